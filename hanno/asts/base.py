@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from sys import intern
 from typing import final, Iterable, Optional, Sequence, Tuple, Union
 
 ValidScalarTypes = Union[bool, int, float, str]
@@ -15,6 +16,8 @@ class ASTNode(ABC):
         The position in the source text that this AST node came from.
     """
 
+    __slots__ = ("span",)
+
     def __init__(self, span: Span) -> None:
         self.span: Span = span
 
@@ -27,7 +30,7 @@ class ASTNode(ABC):
 
 
 class Annotation(ASTNode):
-    __slots__ = ("name", "span", "type_")
+    __slots__ = ("name", "type_")
 
     def __init__(self, span: Span, name: "Name", type_: "Type") -> None:
         super(Annotation, self).__init__(span)
@@ -47,7 +50,7 @@ class Annotation(ASTNode):
 
 
 class Apply(ASTNode):
-    __slots__ = ("arg", "func", "span")
+    __slots__ = ("arg", "func")
 
     def __init__(self, span: Span, func: ASTNode, arg: ASTNode) -> None:
         super().__init__(span)
@@ -66,7 +69,7 @@ class Apply(ASTNode):
 
 
 class Block(ASTNode):
-    __slots__ = ("body", "span")
+    __slots__ = ("body",)
 
     def __init__(self, span: Span, body: Sequence[ASTNode]) -> None:
         if not body:
@@ -107,7 +110,7 @@ class Block(ASTNode):
 
 
 class Cond(ASTNode):
-    __slots__ = ("cons", "else_", "pred", "span")
+    __slots__ = ("cons", "else_", "pred")
 
     def __init__(
         self, span: Span, pred: ASTNode, cons: ASTNode, else_: ASTNode
@@ -133,7 +136,7 @@ class Cond(ASTNode):
 
 
 class Define(ASTNode):
-    __slots__ = ("span", "target", "value")
+    __slots__ = ("target", "value")
 
     def __init__(self, span: Span, target: "Pattern", value: ASTNode) -> None:
         super().__init__(span)
@@ -152,7 +155,7 @@ class Define(ASTNode):
 
 
 class Function(ASTNode):
-    __slots__ = ("body", "param", "span")
+    __slots__ = ("body", "param")
 
     def __init__(self, span: Span, param: "Pattern", body: ASTNode) -> None:
         super().__init__(span)
@@ -171,7 +174,7 @@ class Function(ASTNode):
 
 
 class List(ASTNode):
-    __slots__ = ("elements", "span")
+    __slots__ = ("elements",)
 
     def __init__(self, span: Span, elements: Iterable[ASTNode]) -> None:
         super().__init__(span)
@@ -194,7 +197,7 @@ class List(ASTNode):
 
 
 class Match(ASTNode):
-    __slots__ = ("cases", "span", "subject")
+    __slots__ = ("cases", "subject")
 
     def __init__(
         self, span: Span, subject: ASTNode, cases: Sequence[Tuple["Pattern", ASTNode]]
@@ -220,14 +223,14 @@ class Match(ASTNode):
 
 
 class Name(ASTNode):
-    __slots__ = ("span", "value")
+    __slots__ = ("value",)
 
     def __init__(self, span: Span, value: Optional[str]) -> None:
         if value is None:
             raise TypeError("`value` is supposed to be a string, not None.")
 
         super().__init__(span)
-        self.value: str = value
+        self.value: str = intern(value)
 
     def visit(self, visitor):
         return visitor.visit_name(self)
@@ -244,7 +247,7 @@ class Name(ASTNode):
 
 
 class Pair(ASTNode):
-    __slots__ = ("first", "second", "span")
+    __slots__ = ("first", "second")
 
     def __init__(self, span: Span, first: ASTNode, second: ASTNode) -> None:
         super().__init__(span)
@@ -263,23 +266,32 @@ class Pair(ASTNode):
 
 
 class Pattern(ASTNode):
+    __slots__ = ()
+
     @final
     def visit(self, visitor):
         return visitor.visit_pattern(self)
 
 
 class FreeName(Pattern):
+    __slots__ = ("value",)
+
     def __init__(self, span: Span, value: str) -> None:
         super().__init__(span)
-        self.value: str = value
+        self.value: str = intern(value)
 
     def __eq__(self, other) -> bool:
         if isinstance(other, FreeName):
             return self.value == other.value
         return NotImplemented
 
+    def __hash__(self) -> int:
+        return hash(self.value)
+
 
 class ListPattern(Pattern):
+    __slots__ = ("initial_patterns", "rest")
+
     def __init__(
         self, span: Span, initial_patterns: Sequence[Pattern], rest: Optional[FreeName]
     ) -> None:
@@ -294,6 +306,8 @@ class ListPattern(Pattern):
 
 
 class PairPattern(Pattern):
+    __slots__ = ("first", "second")
+
     def __init__(self, span: Span, first: Pattern, second: Pattern) -> None:
         super().__init__(span)
         self.first: Pattern = first
@@ -306,6 +320,8 @@ class PairPattern(Pattern):
 
 
 class PinnedName(Pattern):
+    __slots__ = ("value",)
+
     def __init__(self, span: Span, value: str) -> None:
         super().__init__(span)
         self.value: str = value
@@ -317,6 +333,8 @@ class PinnedName(Pattern):
 
 
 class ScalarPattern(Pattern):
+    __slots__ = ("value",)
+
     def __init__(self, span: Span, value: ValidScalarTypes) -> None:
         super().__init__(span)
         self.value: ValidScalarTypes = value
@@ -328,12 +346,14 @@ class ScalarPattern(Pattern):
 
 
 class UnitPattern(Pattern):
+    __slots__ = ()
+
     def __eq__(self, other) -> bool:
         return isinstance(other, UnitPattern)
 
 
 class Scalar(ASTNode):
-    __slots__ = ("span", "value")
+    __slots__ = ("value",)
 
     def __init__(self, span: Span, value: ValidScalarTypes) -> None:
         super().__init__(span)
@@ -352,7 +372,7 @@ class Scalar(ASTNode):
 
 
 class Unit(ASTNode):
-    __slots__ = ("span",)
+    __slots__ = ()
 
     def visit(self, visitor):
         return visitor.visit_unit(self)
@@ -1,13 +1,15 @@
 from abc import ABC
 from collections import defaultdict
-from enum import Enum, unique
+from enum import unique
+from sys import intern
 from typing import Any, MutableMapping, Sequence, Optional, Union
 
+from indexed_enum import IndexedEnum
 from .base import ASTNode
 
 
 @unique
-class OperationTypes(Enum):
+class OperationTypes(IndexedEnum):
     """The different types of operations that are allowed in the AST."""
 
     ADD = "+"
@@ -32,13 +34,15 @@ class OperationTypes(Enum):
 
 
 class LoweredASTNode(ASTNode, ABC):
+    __slots__ = ("metadata",)
+
     def __init__(self) -> None:
         super().__init__((0, 0))
         self.metadata: MutableMapping[str, Any] = defaultdict(lambda: None)
 
 
 class Apply(LoweredASTNode):
-    __slots__ = ("args", "func", "metadata")
+    __slots__ = ("arg", "func")
 
     def __init__(self, func: LoweredASTNode, arg: LoweredASTNode) -> None:
         super().__init__()
@@ -57,7 +61,7 @@ class Apply(LoweredASTNode):
 
 
 class Block(LoweredASTNode):
-    __slots__ = ("body", "metadata")
+    __slots__ = ("body",)
 
     def __init__(self, body: Sequence[LoweredASTNode]) -> None:
         if not body:
@@ -93,7 +97,7 @@ class Block(LoweredASTNode):
 
 
 class Cond(LoweredASTNode):
-    __slots__ = ("cons", "else_", "pred", "metadata")
+    __slots__ = ("cons", "else_", "pred")
 
     def __init__(
         self, pred: LoweredASTNode, cons: LoweredASTNode, else_: LoweredASTNode
@@ -118,7 +122,7 @@ class Cond(LoweredASTNode):
 
 
 class Define(LoweredASTNode):
-    __slots__ = ("target", "value", "metadata")
+    __slots__ = ("target", "value")
 
     def __init__(self, target: "Name", value: LoweredASTNode) -> None:
         super().__init__()
@@ -139,7 +143,7 @@ class Define(LoweredASTNode):
 
 
 class Function(LoweredASTNode):
-    __slots__ = ("body", "param", "metadata")
+    __slots__ = ("body", "param")
 
     def __init__(self, param: "Name", body: LoweredASTNode) -> None:
         super().__init__()
@@ -158,7 +162,7 @@ class Function(LoweredASTNode):
 
 
 class List(LoweredASTNode):
-    __slots__ = ("elements", "metadata")
+    __slots__ = ("elements",)
 
     def __init__(self, elements: Sequence[LoweredASTNode]) -> None:
         super().__init__()
@@ -174,7 +178,7 @@ class List(LoweredASTNode):
 
 
 class Pair(LoweredASTNode):
-    __slots__ = ("first", "second", "metadata")
+    __slots__ = ("first", "second")
 
     def __init__(self, first: LoweredASTNode, second: LoweredASTNode) -> None:
         super().__init__()
@@ -195,11 +199,11 @@ class Pair(LoweredASTNode):
 
 
 class Name(LoweredASTNode):
-    __slots__ = ("value", "metadata")
+    __slots__ = ("value",)
 
     def __init__(self, value: str) -> None:
         super().__init__()
-        self.value: str = value
+        self.value: str = intern(value)
 
     def visit(self, visitor) -> None:
         return visitor.visit_name(self)
@@ -211,11 +215,12 @@ class Name(LoweredASTNode):
             return self.value == other.value
         return NotImplemented
 
-    __hash__ = object.__hash__
+    def __hash__(self) -> int:
+        return hash(self.value)
 
 
 class NativeOp(LoweredASTNode):
-    __slots__ = ("left", "operation", "right", "metadata")
+    __slots__ = ("left", "operation", "right")
 
     def __init__(
         self,
@@ -243,7 +248,7 @@ class NativeOp(LoweredASTNode):
 
 
 class Scalar(LoweredASTNode):
-    __slots__ = ("value", "metadata")
+    __slots__ = ("value",)
 
     def __init__(self, value: Union[str, int, float, bool]) -> None:
         super().__init__()
@@ -259,7 +264,7 @@ class Scalar(LoweredASTNode):
 
 
 class Unit(LoweredASTNode):
-    __slots__ = ("metadata",)
+    __slots__ = ()
 
     def visit(self, visitor):
         return visitor.visit_unit(self)
@@ -15,6 +15,8 @@ class Type(ASTNode, ABC):
       subclasses.
     """
 
+    __slots__ = ()
+
     @final
     def visit(self, visitor):
         return visitor.visit_type(self)
@@ -27,7 +29,7 @@ class Type(ASTNode, ABC):
 
 
 class TypeApply(Type):
-    __slots__ = ("callee", "caller", "span", "type_")
+    __slots__ = ("callee", "caller", "type_")
 
     def __init__(self, span: Span, caller: Type, callee: Type) -> None:
         super().__init__(span)
@@ -52,10 +54,9 @@ class TypeApply(Type):
         if len(elems) == 1:
             return elems[0]
 
-        *elems, second_last, last = elems
-        result = cls.pair(span, second_last, last)
-        for elem in elems:
-            result = cls.pair(span, elem, result)
+        result = elems[-1]
+        for index in range(len(elems) - 2, -1, -1):
+            result = cls.pair(span, elems[index], result)
         return result
 
     def __eq__(self, other) -> bool:
@@ -75,7 +76,7 @@ class TypeApply(Type):
 
 
 class TypeName(Type):
-    __slots__ = ("span", "value")
+    __slots__ = ("value",)
 
     def __init__(self, span: Span, value: str) -> None:
         super().__init__(span)
@@ -103,7 +104,7 @@ class TypeName(Type):
 
 
 class TypeScheme(Type):
-    __slots__ = ("actual_type", "bound_type", "span", "type_")
+    __slots__ = ("actual_type", "bound_types", "type_")
 
     def __init__(self, actual_type: Type, bound_types: AbstractSet["TypeVar"]) -> None:
         super().__init__(actual_type.span)
@@ -127,7 +128,7 @@ class TypeScheme(Type):
 
 
 class TypeVar(Type):
-    __slots__ = ("span", "type_", "value")
+    __slots__ = ("type_", "value")
     n_type_vars = 0
 
     def __init__(self, span: Span, value: str) -> None:
@@ -1,5 +1,14 @@
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Generic,
+    Mapping,
+    Type as PyType,
+    TypeVar,
+)
 
 from . import base, lowered, typed
 from .types_ import Type
@@ -8,6 +17,20 @@ _BaseReturnType = TypeVar("_BaseReturnType", covariant=True)
 _TypedReturnType = TypeVar("_TypedReturnType", covariant=True)
 _LoweredReturnType = TypeVar("_LoweredReturnType", covariant=True)
 
+_LOWERED_VISIT_METHODS: Mapping[PyType[lowered.LoweredASTNode], str] = {
+    lowered.Apply: "visit_apply",
+    lowered.Block: "visit_block",
+    lowered.Cond: "visit_cond",
+    lowered.Define: "visit_define",
+    lowered.Function: "visit_function",
+    lowered.List: "visit_list",
+    lowered.Pair: "visit_pair",
+    lowered.Name: "visit_name",
+    lowered.NativeOp: "visit_native_op",
+    lowered.Scalar: "visit_scalar",
+    lowered.Unit: "visit_unit",
+}
+
 
 class BaseASTVisitor(Generic[_BaseReturnType], ABC):
     """
@@ -131,6 +154,17 @@ class LoweredASTVisitor(Generic[_LoweredReturnType], ABC):
     AST nodes kept in `asts.lowered`.
     """
 
+    _dispatch: ClassVar[Dict[PyType[lowered.LoweredASTNode], Callable[..., Any]]]
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        # NOTE: The `visit_*` methods are looked up once per class so that
+        #  `visit` only needs a single dict lookup per node.
+        cls._dispatch = {
+            node_type: getattr(cls, method_name)
+            for node_type, method_name in _LOWERED_VISIT_METHODS.items()
+        }
+
     def run(self, node: lowered.LoweredASTNode) -> _LoweredReturnType:
         """
         Run this visitor on the entire tree as if `node` is the root of
@@ -141,7 +175,35 @@ class LoweredASTVisitor(Generic[_LoweredReturnType], ABC):
         node: lowered.ASTNode
             The (assumed) root node for the entire AST.
         """
-        return node.visit(self)
+        return self.visit(node)
+
+    def visit(self, node: lowered.LoweredASTNode) -> _LoweredReturnType:
+        """
+        Run the `visit_*` method of this visitor that matches the type
+        of `node`.
+
+        Parameters
+        ----------
+        node: lowered.LoweredASTNode
+            The node that will be visited.
+        """
+        method = self._dispatch.get(type(node))
+        if method is None:
+            method = self._find_visit_method(type(node))
+        return method(self, node)
+
+    @classmethod
+    def _find_visit_method(
+        cls, node_type: PyType[lowered.LoweredASTNode]
+    ) -> Callable[..., Any]:
+        for parent in node_type.__mro__[1:]:
+            method = cls._dispatch.get(parent)
+            if method is not None:
+                cls._dispatch[node_type] = method
+                return method
+        raise TypeError(
+            f"{node_type} is an invalid subtype of asts.lowered.LoweredASTNode"
+        )
 
     @abstractmethod
     def visit_apply(self, node: lowered.Apply) -> _LoweredReturnType: ...
@@ -1,9 +1,10 @@
+from re import compile as re_compile, DOTALL
 from typing import Iterator, Tuple
 
-from . import BYTE_ORDER
+_run_pattern = re_compile(rb"(.)\1*", DOTALL)
 
 
-def compress(original: bytes) -> tuple[bool, bytes]:
+def compress(original: bytes) -> tuple[bytes, bool]:
     """
     Shrink down the bytecode by using a simple run-length encoding.
 
@@ -37,21 +38,9 @@ def generate_lengths(source: bytes) -> Iterator[Tuple[int, bytes]]:
     Iterator[Tuple[int, bytes]]
         A stream of pairs of the run length and the character.
     """
-    amount = 1
-    prev_char = None
-    char = -1
-    for char in source:
-        if char == prev_char:
-            amount += 1
-            continue
-
-        if prev_char is not None:
-            yield (amount, prev_char.to_bytes(1, BYTE_ORDER))
-        amount = 1
-        prev_char = char
-
-    if char != -1:
-        yield (amount, char.to_bytes(1, BYTE_ORDER))
+    for match in _run_pattern.finditer(source):
+        start, end = match.span()
+        yield (end - start, match.group(1))
 
 
 def rebuild_stream(stream: Iterator[Tuple[int, bytes]]) -> bytes:
@@ -69,9 +58,7 @@ def rebuild_stream(stream: Iterator[Tuple[int, bytes]]) -> bytes:
     bytes
         The final byte stream.
     """
-    return b"".join(
-        amount.to_bytes(1, BYTE_ORDER) + char for amount, char in normalise(stream)
-    )
+    return b"".join([bytes((amount,)) + char for amount, char in normalise(stream)])
 
 
 def normalise(stream: Iterator[Tuple[int, bytes]]) -> Iterator[Tuple[int, bytes]]:
@@ -1,17 +1,31 @@
 from codecs import lookup
 from decimal import Decimal
 from enum import Enum, unique
-from functools import reduce
-from operator import add, methodcaller
-from typing import Any, Iterable, List, Mapping, NamedTuple, Sequence
+from struct import Struct
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+)
 
 from asts import lowered, visitor
-from errors import NumberOverflowError
+from errors import NumberOverflowError, UndefinedNameError
 from log import logger
 from scope import Scope
 from . import BYTE_ORDER, compress
 
 SECTION_SEP = b"\x00" * 5
+_OPERAND_PADDING = b"\x00" * 7
+
+_byte_order_prefix = ">" if BYTE_ORDER == "big" else "<"
+_pack_u8 = Struct(_byte_order_prefix + "B").pack
+_pack_u32 = Struct(_byte_order_prefix + "I").pack
 STRING_ENCODING = "UTF-8"
 NATIVE_OP_CODES: Mapping[lowered.OperationTypes, int] = {
     lowered.OperationTypes.ADD: 1,
@@ -52,17 +66,37 @@ class OpCodes(Enum):
     BRANCH = 13
 
 
+OPCODE_BYTES: Mapping[OpCodes, bytes] = {
+    opcode: opcode.value.to_bytes(1, BYTE_ORDER) for opcode in OpCodes
+}
+SCALAR_OPCODES: Mapping[type, OpCodes] = {
+    bool: OpCodes.LOAD_BOOL,
+    float: OpCodes.LOAD_FLOAT,
+    int: OpCodes.LOAD_INT,
+    str: OpCodes.LOAD_STRING,
+}
+
 Instruction = NamedTuple(
     "Instruction", (("opcode", OpCodes), ("operands", tuple[Any, ...]))
 )
+_native_instructions: Sequence[Instruction] = tuple(
+    Instruction(OpCodes.NATIVE, (NATIVE_OP_CODES[operation],))
+    for operation in lowered.OperationTypes
+)
+OperandEncoder = Callable[
+    [tuple[Any, ...], List[bytes], List[bytes], Dict[bytes, int]], bytes
+]
 
 
-class InstructionGenerator(visitor.LoweredASTVisitor[Sequence[Instruction]]):
+class InstructionGenerator(visitor.LoweredASTVisitor[None]):
     """
     Turn the AST into a linear stream of bytecode instructions.
 
     Attributes
     ----------
+    out: List[Instruction]
+        The list that the instructions for the code currently being
+        visited are written into.
     current_index: int
         The number given to the next unique name found in a scope.
     prev_indexes: Sequence[int]
@@ -78,11 +112,31 @@ class InstructionGenerator(visitor.LoweredASTVisitor[Sequence[Instruction]]):
     """
 
     def __init__(self) -> None:
+        self.out: List[Instruction] = []
         self.current_index: int = 0
         self.prev_indexes: List[int] = []
         self.current_scope: Scope[int] = Scope(None)
         self.function_level: int = 0
 
+    def generate(self, node: lowered.LoweredASTNode) -> List[Instruction]:
+        """
+        Generate the instructions for `node` and everything inside it.
+
+        Parameters
+        ----------
+        node: lowered.LoweredASTNode
+            The root node of the (sub)tree to generate code for.
+
+        Returns
+        -------
+        List[Instruction]
+            The bytecode instructions in the order they will be run.
+        """
+        prev_out, self.out = self.out, []
+        self.visit(node)
+        result, self.out = self.out, prev_out
+        return result
+
     def _push_scope(self) -> None:
         self.current_scope = Scope(self.current_scope)
         self.prev_indexes.append(self.current_index)
@@ -92,99 +146,86 @@ class InstructionGenerator(visitor.LoweredASTVisitor[Sequence[Instruction]]):
         self.current_scope = self.current_scope.up()
         self.current_index = self.prev_indexes.pop()
 
-    def visit_apply(self, node: lowered.Apply) -> Sequence[Instruction]:
-        return (
-            *node.arg.visit(self),
-            *node.func.visit(self),
-            Instruction(OpCodes.APPLY, ()),
-        )
+    def visit_apply(self, node: lowered.Apply) -> None:
+        self.visit(node.arg)
+        self.visit(node.func)
+        self.out.append(Instruction(OpCodes.APPLY, ()))
 
-    def visit_block(self, node: lowered.Block) -> Sequence[Instruction]:
+    def visit_block(self, node: lowered.Block) -> None:
         self._push_scope()
-        result = tuple(_chain(map(methodcaller("visit", self), node.body)))
+        for expr in node.body:
+            self.visit(expr)
         self._pop_scope()
-        return result
-
-    def visit_cond(self, node: lowered.Cond) -> Sequence[Instruction]:
-        cons_body = node.cons.visit(self)
-        else_body = node.else_.visit(self)
-        return (
-            *node.pred.visit(self),
-            Instruction(OpCodes.BRANCH, (len(cons_body) + 1,)),
-            *cons_body,
-            Instruction(OpCodes.JUMP, (len(else_body),)),
-            *else_body,
-        )
 
-    def visit_define(self, node: lowered.Define) -> Sequence[Instruction]:
-        value = node.value.visit(self)
-        if node.target not in self.current_scope:
-            self.current_scope[node.target] = self.current_index
+    def visit_cond(self, node: lowered.Cond) -> None:
+        cons_body = self.generate(node.cons)
+        else_body = self.generate(node.else_)
+        self.visit(node.pred)
+        out = self.out
+        out.append(Instruction(OpCodes.BRANCH, (len(cons_body) + 1,)))
+        out.extend(cons_body)
+        out.append(Instruction(OpCodes.JUMP, (len(else_body),)))
+        out.extend(else_body)
+
+    def visit_define(self, node: lowered.Define) -> None:
+        self.visit(node.value)
+        try:
+            depth, position = self.current_scope.lookup(node.target)
+        except UndefinedNameError:
+            position = self.current_index
+            self.current_scope[node.target] = position
             self.current_index += 1
             depth = 0
         else:
-            depth = self.current_scope.depth(node.target)
             depth = 0 if self.function_level and depth else (depth + 1)
-        return (
-            *value,
-            Instruction(OpCodes.STORE_NAME, (depth, self.current_scope[node.target])),
-        )
+        self.out.append(Instruction(OpCodes.STORE_NAME, (depth, position)))
 
-    def visit_function(self, node: lowered.Function) -> Sequence[Instruction]:
+    def visit_function(self, node: lowered.Function) -> None:
         self._push_scope()
         self.function_level += 1
         self.current_scope[node.param] = 0
         self.current_index += 1
-        func_body = node.body.visit(self)
+        func_body = self.generate(node.body)
         self.function_level -= 1
         self._pop_scope()
-        return (Instruction(OpCodes.LOAD_FUNC, (func_body,)),)
-
-    def visit_list(self, node: lowered.List) -> Sequence[Instruction]:
-        elements = tuple(node.elements)
-        elem_instructions = tuple(_chain(map(self.run, elements)))
-        return (
-            *elem_instructions,
-            Instruction(OpCodes.BUILD_LIST, (len(elements),)),
-        )
-
-    def visit_pair(self, node: lowered.Pair) -> Sequence[Instruction]:
-        return (
-            *node.second.visit(self),
-            *node.first.visit(self),
-            Instruction(OpCodes.BUILD_PAIR, ()),
-        )
-
-    def visit_name(self, node: lowered.Name) -> Sequence[Instruction]:
-        if node not in self.current_scope:
-            self.current_scope[node] = self.current_index
+        self.out.append(Instruction(OpCodes.LOAD_FUNC, (tuple(func_body),)))
+
+    def visit_list(self, node: lowered.List) -> None:
+        size = 0
+        for elem in node.elements:
+            self.visit(elem)
+            size += 1
+        self.out.append(Instruction(OpCodes.BUILD_LIST, (size,)))
+
+    def visit_pair(self, node: lowered.Pair) -> None:
+        self.visit(node.second)
+        self.visit(node.first)
+        self.out.append(Instruction(OpCodes.BUILD_PAIR, ()))
+
+    def visit_name(self, node: lowered.Name) -> None:
+        try:
+            depth, position = self.current_scope.lookup(node)
+        except UndefinedNameError:
+            position = self.current_index
+            self.current_scope[node] = position
             self.current_index += 1
+            depth = 0
 
-        depth = self.current_scope.depth(node)
         depth = 0 if self.function_level and depth else (depth + 1)
-        position = self.current_scope[node]
-        return (Instruction(OpCodes.LOAD_NAME, (depth, position)),)
-
-    def visit_native_op(self, node: lowered.NativeOp) -> Sequence[Instruction]:
-        right = () if node.right is None else node.right.visit(self)
-        op_index = NATIVE_OP_CODES[node.operation]
-        return (
-            *right,
-            *node.left.visit(self),
-            Instruction(OpCodes.NATIVE, (op_index,)),
-        )
+        self.out.append(Instruction(OpCodes.LOAD_NAME, (depth, position)))
 
-    def visit_scalar(self, node: lowered.Scalar) -> Sequence[Instruction]:
-        opcode: OpCodes = {
-            bool: OpCodes.LOAD_BOOL,
-            float: OpCodes.LOAD_FLOAT,
-            int: OpCodes.LOAD_INT,
-            str: OpCodes.LOAD_STRING,
-        }[type(node.value)]
-        return (Instruction(opcode, (node.value,)),)
+    def visit_native_op(self, node: lowered.NativeOp) -> None:
+        if node.right is not None:
+            self.visit(node.right)
+        self.visit(node.left)
+        self.out.append(_native_instructions[node.operation.index])
 
-    def visit_unit(self, node: lowered.Unit) -> Sequence[Instruction]:
-        return (Instruction(OpCodes.LOAD_UNIT, ()),)
+    def visit_scalar(self, node: lowered.Scalar) -> None:
+        opcode = SCALAR_OPCODES[type(node.value)]
+        self.out.append(Instruction(opcode, (node.value,)))
+
+    def visit_unit(self, node: lowered.Unit) -> None:
+        self.out.append(Instruction(OpCodes.LOAD_UNIT, ()))
 
 
 def to_bytecode(ast: lowered.LoweredASTNode, compress_code: bool = False) -> bytes:
@@ -206,7 +247,7 @@ def to_bytecode(ast: lowered.LoweredASTNode, compress_code: bool = False) -> byt
         The resulting stream of bytes that represent the bytecode
         instruction objects.
     """
-    instructions = InstructionGenerator().run(ast)
+    instructions = InstructionGenerator().generate(ast)
     stream, func_pool, string_pool = encode_instructions(instructions, [], [])
     funcs, strings = encode_pool(func_pool), encode_pool(string_pool)
     header = generate_header(len(stream), len(funcs), len(strings), STRING_ENCODING)
@@ -229,8 +270,11 @@ def encode_pool(pool: Iterable[bytes]) -> bytes:
         A single `bytes` object that carries the entire pool in the
         order passed to the function.
     """
-    convert = lambda item: len(item).to_bytes(4, BYTE_ORDER) + item
-    return reduce(add, map(convert, pool), b"")
+    parts: List[bytes] = []
+    for item in pool:
+        parts.append(_pack_u32(len(item)))
+        parts.append(item)
+    return b"".join(parts)
 
 
 def generate_header(
@@ -262,8 +306,8 @@ def generate_header(
     encoding_name = lookup(encoding_used).name.encode("ASCII")
     return b"O%bF%bS%bE%b" % (
         b"\xFF" if BYTE_ORDER == "big" else b"\x00",
-        func_pool_size.to_bytes(4, BYTE_ORDER),
-        string_pool_size.to_bytes(4, BYTE_ORDER),
+        _pack_u32(func_pool_size),
+        _pack_u32(string_pool_size),
         encoding_name.ljust(11, b"\x00"),
     )
 
@@ -306,6 +350,7 @@ def encode_instructions(
     stream: Sequence[Instruction],
     func_pool: List[bytes],
     string_pool: List[bytes],
+    string_indexes: Optional[Dict[bytes, int]] = None,
 ) -> tuple[bytearray, List[bytes], List[bytes]]:
     """
     Encode the bytecode stream as a single `bytes` object that can be
@@ -321,6 +366,10 @@ def encode_instructions(
     string_pool: List[bytes]
         Where string objects are stored before being put in the final
         bytecode stream.
+    string_indexes: Optional[Dict[bytes, int]] = None
+        A lookaside mapping each string already in `string_pool` to its
+        index so that repeated strings share a single pool entry. If it
+        is not given, it will be built from `string_pool`.
 
     Returns
     -------
@@ -328,14 +377,18 @@ def encode_instructions(
         The encoded stream of bytecode instructions. It is guaranteed
         to have a length proportional to the length of `stream`.
     """
-    result = bytearray(len(stream) * 8)
-    for index, instruction in enumerate(stream):
-        start = index * 8
-        end = start + 8
+    if string_indexes is None:
+        string_indexes = _index_pool(string_pool)
+
+    result = bytearray()
+    extend = result.extend
+    for opcode, operands in stream:
         operand = encode_operands(
-            instruction.opcode, instruction.operands, func_pool, string_pool
-        ).ljust(7, b"\x00")
-        result[start:end] = instruction.opcode.value.to_bytes(1, BYTE_ORDER) + operand
+            opcode, operands, func_pool, string_pool, string_indexes
+        )
+        extend(OPCODE_BYTES[opcode])
+        extend(operand)
+        extend(_OPERAND_PADDING[len(operand) :])
     return result, func_pool, string_pool
 
 
@@ -344,6 +397,7 @@ def encode_operands(
     operands: tuple[Any, ...],
     func_pool: List[bytes],
     string_pool: List[bytes],
+    string_indexes: Optional[Dict[bytes, int]] = None,
 ) -> bytes:
     """
     Encode the operands of a single bytecode instruction.
@@ -361,6 +415,10 @@ def encode_operands(
     string_pool: List[bytes]
         Where string objects are stored before being put in the final
         bytecode stream.
+    string_indexes: Optional[Dict[bytes, int]] = None
+        A lookaside mapping each string already in `string_pool` to its
+        index so that repeated strings share a single pool entry. If it
+        is not given, it will be built from `string_pool`.
 
     Returns
     -------
@@ -369,27 +427,19 @@ def encode_operands(
         of 7 (the 8th byte is reserved for the opcode and will be
         prepended later on).
     """
-    if opcode == OpCodes.LOAD_BOOL:
-        return b"\xff" if operands[0] else b"\x00"
-    if opcode == OpCodes.LOAD_STRING:
-        return _encode_load_string(operands[0], string_pool)
-    if opcode == OpCodes.LOAD_INT:
-        return _encode_load_int(operands[0])
-    if opcode == OpCodes.LOAD_FLOAT:
-        return _encode_load_float(operands[0])
-    if opcode == OpCodes.LOAD_FUNC:
-        return _encode_load_func(operands[0], func_pool, string_pool)
-    if opcode == OpCodes.BUILD_LIST:
-        return operands[0].to_bytes(4, BYTE_ORDER)
-    if opcode == OpCodes.NATIVE:
-        return operands[0].to_bytes(1, BYTE_ORDER)
-    if opcode in (OpCodes.BRANCH, OpCodes.JUMP):
-        return operands[0].to_bytes(7, BYTE_ORDER)
-    if opcode in (OpCodes.LOAD_NAME, OpCodes.STORE_NAME):
-        return operands[0].to_bytes(3, BYTE_ORDER, signed=False) + operands[1].to_bytes(
-            4, BYTE_ORDER, signed=False
-        )
-    return b""
+    encoder = _operand_encoders.get(opcode)
+    if encoder is None:
+        return b""
+    if string_indexes is None:
+        string_indexes = _index_pool(string_pool)
+    return encoder(operands, func_pool, string_pool, string_indexes)
+
+
+def _index_pool(pool: Sequence[bytes]) -> Dict[bytes, int]:
+    indexes: Dict[bytes, int] = {}
+    for index, entry in enumerate(pool):
+        indexes.setdefault(entry, index)
+    return indexes
 
 
 def _encode_load_int(value: int) -> bytes:
@@ -404,13 +454,8 @@ def _encode_load_int(value: int) -> bytes:
 
 def _encode_load_float(value: float) -> bytes:
     data = Decimal(value).as_tuple()
-    max_index = len(data.digits)
-    digits = abs(
-        sum(
-            digit * (10 ** (max_index + 1 - index))
-            for index, digit in enumerate(data.digits)
-        )
-    )
+    # NOTE: The VM expects the digits to be shifted up by 2 places.
+    digits = int("".join(map(str, data.digits))) * 100
     try:
         digits = -digits if data.sign else digits
         exponent = abs(data.exponent)
@@ -424,19 +469,41 @@ def _encode_load_float(value: float) -> bytes:
         return result
 
 
-def _encode_load_string(string, string_pool):
-    string_pool.append(string.encode(STRING_ENCODING))
-    pool_index = len(string_pool) - 1
+def _encode_load_string(string, string_pool, string_indexes):
+    encoded = string.encode(STRING_ENCODING)
+    pool_index = string_indexes.get(encoded)
+    if pool_index is None:
+        pool_index = len(string_pool)
+        string_pool.append(encoded)
+        string_indexes[encoded] = pool_index
     return pool_index.to_bytes(7, BYTE_ORDER, signed=False)
 
 
-def _encode_load_func(func_body, func_pool, string_pool):
-    body_code, _, _ = encode_instructions(func_body, func_pool, string_pool)
+def _encode_load_func(func_body, func_pool, string_pool, string_indexes):
+    body_code, _, _ = encode_instructions(
+        func_body, func_pool, string_pool, string_indexes
+    )
     func_pool.append(body_code)
     pool_index = len(func_pool) - 1
     return pool_index.to_bytes(7, BYTE_ORDER)
 
 
-def _chain(iterators):
-    for iterator in iterators:
-        yield from iterator
+_encode_name = lambda operands, *_: operands[0].to_bytes(
+    3, BYTE_ORDER, signed=False
+) + _pack_u32(operands[1])
+
+_operand_encoders: Mapping[OpCodes, OperandEncoder] = {
+    OpCodes.LOAD_BOOL: lambda operands, *_: b"\xff" if operands[0] else b"\x00",
+    OpCodes.LOAD_STRING: lambda operands, _, pool, indexes: _encode_load_string(
+        operands[0], pool, indexes
+    ),
+    OpCodes.LOAD_INT: lambda operands, *_: _encode_load_int(operands[0]),
+    OpCodes.LOAD_FLOAT: lambda operands, *_: _encode_load_float(operands[0]),
+    OpCodes.LOAD_FUNC: lambda operands, *pools: _encode_load_func(operands[0], *pools),
+    OpCodes.BUILD_LIST: lambda operands, *_: _pack_u32(operands[0]),
+    OpCodes.NATIVE: lambda operands, *_: _pack_u8(operands[0]),
+    OpCodes.BRANCH: lambda operands, *_: operands[0].to_bytes(7, BYTE_ORDER),
+    OpCodes.JUMP: lambda operands, *_: operands[0].to_bytes(7, BYTE_ORDER),
+    OpCodes.LOAD_NAME: _encode_name,
+    OpCodes.STORE_NAME: _encode_name,
+}
@@ -1,11 +1,13 @@
 from functools import reduce
-from typing import List, Optional, Sequence, Tuple, Union
+from typing import List, Mapping, Optional, Sequence, Tuple, Union
 
 from asts import base, lowered, types_, visitor
 from errors import FatalInternalError, merge, PatternPosition, RefutablePatternError
 from log import logger
 
-BINARY_OPS = {op.value for op in lowered.OperationTypes}
+BINARY_OPS: Mapping[str, lowered.OperationTypes] = {
+    op.value: op for op in lowered.OperationTypes
+}
 NEW_NAME_INDEX = 0
 TRUE_NODE = base.Scalar((0, 0), True)
 
@@ -56,14 +58,10 @@ class Simplifier(visitor.BaseASTVisitor[lowered.LoweredASTNode]):
         func, arg = node.func.visit(self), node.arg.visit(self)
         if func == "~":
             return lowered.NativeOp(lowered.OperationTypes.NEG, arg)
-        if (
-            isinstance(func, lowered.Apply)
-            and isinstance(func.func, lowered.Name)
-            and func.func.value in BINARY_OPS
-        ):
-            return lowered.NativeOp(
-                lowered.OperationTypes(func.func.value), func.arg, arg
-            )
+        if isinstance(func, lowered.Apply) and isinstance(func.func, lowered.Name):
+            operation = BINARY_OPS.get(func.func.value)
+            if operation is not None:
+                return lowered.NativeOp(operation, func.arg, arg)
         return lowered.Apply(func, arg)
 
     def visit_block(self, node: base.Block) -> lowered.Block:
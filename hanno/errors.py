@@ -65,9 +65,12 @@ def merge(left_span: Span, right_span: Span) -> Span:
     -------
     The maximum possible span.
     """
-    start = min(left_span[0], right_span[0])
-    end = max(left_span[1], right_span[1])
-    return start, end
+    left_start, left_end = left_span
+    right_start, right_end = right_span
+    return (
+        left_start if left_start < right_start else right_start,
+        left_end if left_end > right_end else right_end,
+    )
 
 
 def to_json(error: Exception, source: str, filename: str) -> str:
@@ -1,5 +1,5 @@
 from functools import lru_cache
-from typing import List, MutableMapping, Sequence
+from typing import Any, List, MutableMapping, NoReturn, Sequence
 
 from asts import base, lowered, typed, visitor
 from asts.types_ import Type, TypeApply, TypeName, TypeScheme, TypeVar
@@ -130,68 +130,119 @@ def show_pattern(pattern: base.Pattern) -> str:
     raise TypeError(f"{type(pattern)} is an invalid subtype of asts.base.Pattern")
 
 
-class ASTPrinter(visitor.BaseASTVisitor[str]):
-    """This visitor produces a string version of the entire AST."""
+class _Printer:
+    """
+    The shared state of the AST printers. They all write the pieces of
+    the output into a single buffer which is only joined once at the
+    end, instead of joining the strings for every subtree again at
+    each level above it.
+    """
 
     def __init__(self) -> None:
         self.indent_level: int = -1
         self.indent_char: str = "  "
+        self._parts: List[str] = []
+        self._write = self._parts.append
 
-    def visit_annotation(self, node: base.Annotation) -> str:
-        return f"{node.name.visit(self)} :: {node.type_.visit(self)}"
-
-    def visit_apply(self, node: base.Apply) -> str:
-        return f"{node.func.visit(self)} {node.arg.visit(self)}"
-
-    def visit_block(self, node: base.Block) -> str:
-        self.indent_level += 1
-        preface = f"\n{self.indent_char * self.indent_level}"
-        result = preface + preface.join((expr.visit(self) for expr in node.body))
-        self.indent_level -= 1
+    def _flush(self) -> str:
+        result = "".join(self._parts)
+        self._parts.clear()
         return result
 
-    def visit_cond(self, node: base.Cond) -> str:
-        pred = node.pred.visit(self)
-        cons = node.cons.visit(self)
-        else_ = node.else_.visit(self)
-        return f"if {pred} then {cons} else {else_}"
-
-    def visit_define(self, node: base.Define) -> str:
-        return f"let {node.target.visit(self)} = {node.value.visit(self)}"
-
-    def visit_function(self, node: base.Function) -> str:
-        return f"\\{node.param.visit(self)} -> {node.body.visit(self)}"
-
-    def visit_list(self, node: base.List) -> str:
-        return f"[{', '.join(map(self.run, node.elements))}]"
-
-    def visit_match(self, node: base.Match) -> str:
-        cases = ", ".join(
-            f"{pattern.visit(self)} -> {cons.visit(self)}"
-            for pattern, cons in node.cases
+    def run(self, node: Any) -> NoReturn:
+        raise NotImplementedError(
+            f"`{type(self).__name__}` has no `run`, use `show` to print the tree."
         )
-        return f"case {node.subject.visit(self)} of {cases}"
-
-    def visit_pair(self, node: base.Pair) -> str:
-        return f"({node.first.visit(self)}, {node.second.visit(self)})"
 
-    def visit_pattern(self, node: base.Pattern) -> str:
-        return show_pattern(node)
 
-    def visit_name(self, node: base.Name) -> str:
-        return node.value
+class ASTPrinter(_Printer, visitor.BaseASTVisitor[None]):
+    """This visitor produces a string version of the entire AST."""
 
-    def visit_scalar(self, node: base.Scalar) -> str:
-        return repr(node.value)
+    def show(self, node: base.ASTNode) -> str:
+        node.visit(self)
+        return self._flush()
 
-    def visit_type(self, node: Type) -> str:
-        return show_type(node)
+    def visit_annotation(self, node: base.Annotation) -> None:
+        node.name.visit(self)
+        self._write(" :: ")
+        node.type_.visit(self)
 
-    def visit_unit(self, node: base.Unit) -> str:
-        return "()"
+    def visit_apply(self, node: base.Apply) -> None:
+        node.func.visit(self)
+        self._write(" ")
+        node.arg.visit(self)
 
+    def visit_block(self, node: base.Block) -> None:
+        self.indent_level += 1
+        preface = f"\n{self.indent_char * self.indent_level}"
+        for expr in node.body:
+            self._write(preface)
+            expr.visit(self)
+        self.indent_level -= 1
 
-class TypedASTPrinter(visitor.TypedASTVisitor[str]):
+    def visit_cond(self, node: base.Cond) -> None:
+        self._write("if ")
+        node.pred.visit(self)
+        self._write(" then ")
+        node.cons.visit(self)
+        self._write(" else ")
+        node.else_.visit(self)
+
+    def visit_define(self, node: base.Define) -> None:
+        self._write("let ")
+        node.target.visit(self)
+        self._write(" = ")
+        node.value.visit(self)
+
+    def visit_function(self, node: base.Function) -> None:
+        self._write("\\")
+        node.param.visit(self)
+        self._write(" -> ")
+        node.body.visit(self)
+
+    def visit_list(self, node: base.List) -> None:
+        self._write("[")
+        for index, elem in enumerate(node.elements):
+            if index:
+                self._write(", ")
+            elem.visit(self)
+        self._write("]")
+
+    def visit_match(self, node: base.Match) -> None:
+        self._write("case ")
+        node.subject.visit(self)
+        self._write(" of ")
+        for index, (pattern, cons) in enumerate(node.cases):
+            if index:
+                self._write(", ")
+            pattern.visit(self)
+            self._write(" -> ")
+            cons.visit(self)
+
+    def visit_pair(self, node: base.Pair) -> None:
+        self._write("(")
+        node.first.visit(self)
+        self._write(", ")
+        node.second.visit(self)
+        self._write(")")
+
+    def visit_pattern(self, node: base.Pattern) -> None:
+        self._write(show_pattern(node))
+
+    def visit_name(self, node: base.Name) -> None:
+        self._write(node.value)
+
+    def visit_scalar(self, node: base.Scalar) -> None:
+        self._write(repr(node.value))
+
+    def visit_type(self, node: Type) -> None:
+        self._write(show_type(node))
+
+    def visit_unit(self, node: base.Unit) -> None:
+        self._write("()")
+
+
+class TypedASTPrinter(_Printer, visitor.TypedASTVisitor[None]):
     """
     This visitor produces a string version of the entire AST with full
     type annotations.
@@ -201,117 +252,159 @@ class TypedASTPrinter(visitor.TypedASTVisitor[str]):
     This visitor assumes that the `type_` annotation is never `None`.
     """
 
-    def __init__(self) -> None:
-        self.indent_level: int = -1
-        self.indent_char: str = "  "
+    def show(self, node: typed.TypedASTNode) -> str:
+        node.visit(self)
+        return self._flush()
 
-    def visit_apply(self, node: typed.Apply) -> str:
-        return f"{node.func.visit(self)} {node.arg.visit(self)}"
+    def visit_apply(self, node: typed.Apply) -> None:
+        node.func.visit(self)
+        self._write(" ")
+        node.arg.visit(self)
 
-    def visit_block(self, node: typed.Block) -> str:
+    def visit_block(self, node: typed.Block) -> None:
         self.indent_level += 1
         preface = f"\n{self.indent_char * self.indent_level}"
-        body = preface.join((expr.visit(self) for expr in node.body))
-        result = f"{preface}{body}{preface}# type: {node.type_.visit(self)}"
+        for expr in node.body:
+            self._write(preface)
+            expr.visit(self)
+        self._write(f"{preface}# type: ")
+        node.type_.visit(self)
         self.indent_level -= 1
-        return result
-
-    def visit_cond(self, node: typed.Cond) -> str:
-        pred = node.pred.visit(self)
-        cons = node.cons.visit(self)
-        else_ = node.else_.visit(self)
-        return f"if {pred} then {cons} else {else_}"
-
-    def visit_define(self, node: typed.Define) -> str:
-        return (
-            f"let {show_pattern(node.target)} "
-            f":: {node.type_.visit(self)} "
-            f"= {node.value.visit(self)}"
-        )
-
-    def visit_function(self, node: typed.Function) -> str:
-        return f"\\{show_pattern(node.param)} -> {node.body.visit(self)}"
-
-    def visit_list(self, node: typed.List) -> str:
-        return f"[{', '.join(map(self.run, node.elements))}]"
 
-    def visit_match(self, node: base.Match) -> str:
-        cases = " ".join(
-            f"{show_pattern(pattern)} -> {cons.visit(self)},"
-            for pattern, cons in node.cases
-        )
-        return f"case {node.subject.visit(self)} of ({cases})"
-
-    def visit_pair(self, node: base.Pair) -> str:
-        return f"({node.first.visit(self)}, {node.second.visit(self)})"
-
-    def visit_name(self, node: typed.Name) -> str:
-        return f"[{node.value} :: {node.type_.visit(self)}]"
-
-    def visit_scalar(self, node: typed.Scalar) -> str:
-        return repr(node.value)
-
-    def visit_type(self, node: Type) -> str:
-        return show_type(node)
-
-    def visit_unit(self, node: typed.Unit) -> str:
-        return "()"
-
-
-class LoweredASTPrinter(visitor.LoweredASTVisitor[str]):
+    def visit_cond(self, node: typed.Cond) -> None:
+        self._write("if ")
+        node.pred.visit(self)
+        self._write(" then ")
+        node.cons.visit(self)
+        self._write(" else ")
+        node.else_.visit(self)
+
+    def visit_define(self, node: typed.Define) -> None:
+        self._write(f"let {show_pattern(node.target)} :: ")
+        node.type_.visit(self)
+        self._write(" = ")
+        node.value.visit(self)
+
+    def visit_function(self, node: typed.Function) -> None:
+        self._write(f"\\{show_pattern(node.param)} -> ")
+        node.body.visit(self)
+
+    def visit_list(self, node: typed.List) -> None:
+        self._write("[")
+        for index, elem in enumerate(node.elements):
+            if index:
+                self._write(", ")
+            elem.visit(self)
+        self._write("]")
+
+    def visit_match(self, node: base.Match) -> None:
+        self._write("case ")
+        node.subject.visit(self)
+        self._write(" of (")
+        for index, (pattern, cons) in enumerate(node.cases):
+            if index:
+                self._write(" ")
+            self._write(f"{show_pattern(pattern)} -> ")
+            cons.visit(self)
+            self._write(",")
+        self._write(")")
+
+    def visit_pair(self, node: base.Pair) -> None:
+        self._write("(")
+        node.first.visit(self)
+        self._write(", ")
+        node.second.visit(self)
+        self._write(")")
+
+    def visit_name(self, node: typed.Name) -> None:
+        self._write(f"[{node.value} :: ")
+        node.type_.visit(self)
+        self._write("]")
+
+    def visit_scalar(self, node: typed.Scalar) -> None:
+        self._write(repr(node.value))
+
+    def visit_type(self, node: Type) -> None:
+        self._write(show_type(node))
+
+    def visit_unit(self, node: typed.Unit) -> None:
+        self._write("()")
+
+
+class LoweredASTPrinter(_Printer, visitor.LoweredASTVisitor[None]):
     """This visitor produces a string version of the lowered AST."""
 
-    def __init__(self) -> None:
-        self.indent_level: int = -1
-        self.indent_char: str = "  "
+    def show(self, node: lowered.LoweredASTNode) -> str:
+        self.visit(node)
+        return self._flush()
 
-    def visit_apply(self, node: lowered.Apply) -> str:
-        return f"{node.func.visit(self)}({node.arg.visit(self)})"
+    def visit_apply(self, node: lowered.Apply) -> None:
+        self.visit(node.func)
+        self._write("(")
+        self.visit(node.arg)
+        self._write(")")
 
-    def visit_block(self, node: lowered.Block) -> str:
+    def visit_block(self, node: lowered.Block) -> None:
+        outer_indent = self.indent_char * self.indent_level
+        self._write(f"\n{outer_indent}{{")
         self.indent_level += 1
         preface = f"\n{self.indent_char * self.indent_level}"
-        result = preface.join((expr.visit(self) for expr in node.body))
+        for expr in node.body:
+            self._write(preface)
+            self.visit(expr)
         self.indent_level -= 1
-        return (
-            f"\n{self.indent_char * self.indent_level}{{"
-            f"{preface}{result}\n"
-            f"{self.indent_char * self.indent_level}}}"
-        )
-
-    def visit_cond(self, node: lowered.Cond) -> str:
-        return (
-            f"{node.pred.visit(self)} ? "
-            f"{node.cons.visit(self)} : "
-            f"{node.else_.visit(self)}"
-        )
-
-    def visit_define(self, node: lowered.Define) -> str:
-        return f"{node.target.visit(self)} = {node.value.visit(self)}"
-
-    def visit_function(self, node: lowered.Function) -> str:
-        return f"\\{node.param.visit(self)} -> {node.body.visit(self)}"
-
-    def visit_list(self, node: lowered.List) -> str:
-        return f"[{' , '.join(map(self.run, node.elements))}]"
-
-    def visit_pair(self, node: lowered.Pair) -> str:
-        return f"({node.first.visit(self)}, {node.second.visit(self)})"
-
-    def visit_name(self, node: lowered.Name) -> str:
-        return node.value
-
-    def visit_native_op(self, node: lowered.NativeOp) -> str:
+        self._write(f"\n{outer_indent}}}")
+
+    def visit_cond(self, node: lowered.Cond) -> None:
+        self.visit(node.pred)
+        self._write(" ? ")
+        self.visit(node.cons)
+        self._write(" : ")
+        self.visit(node.else_)
+
+    def visit_define(self, node: lowered.Define) -> None:
+        self.visit(node.target)
+        self._write(" = ")
+        self.visit(node.value)
+
+    def visit_function(self, node: lowered.Function) -> None:
+        self._write("\\")
+        self.visit(node.param)
+        self._write(" -> ")
+        self.visit(node.body)
+
+    def visit_list(self, node: lowered.List) -> None:
+        self._write("[")
+        for index, elem in enumerate(node.elements):
+            if index:
+                self._write(" , ")
+            self.visit(elem)
+        self._write("]")
+
+    def visit_pair(self, node: lowered.Pair) -> None:
+        self._write("(")
+        self.visit(node.first)
+        self._write(", ")
+        self.visit(node.second)
+        self._write(")")
+
+    def visit_name(self, node: lowered.Name) -> None:
+        self._write(node.value)
+
+    def visit_native_op(self, node: lowered.NativeOp) -> None:
         op = node.operation.value
-        left = node.left.visit(self)
-        return (
-            f"({op} {left})"
-            if node.right is None
-            else f"({left} {op} {node.right.visit(self)})"
-        )
-
-    def visit_scalar(self, node: lowered.Scalar) -> str:
-        return repr(node.value)
-
-    def visit_unit(self, node: lowered.Unit) -> str:
-        return "()"
+        self._write("(")
+        if node.right is None:
+            self._write(f"{op} ")
+            self.visit(node.left)
+        else:
+            self.visit(node.left)
+            self._write(f" {op} ")
+            self.visit(node.right)
+        self._write(")")
+
+    def visit_scalar(self, node: lowered.Scalar) -> None:
+        self._write(repr(node.value))
+
+    def visit_unit(self, node: lowered.Unit) -> None:
+        self._write("()")
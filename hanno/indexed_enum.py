@@ -0,0 +1,13 @@
+from enum import Enum
+
+
+class IndexedEnum(Enum):
+    """
+    An enum whose members each have an `index` which is their position
+    in the definition order.
+    """
+
+    def __init__(self, _) -> None:
+        # NOTE: Members are numbered in definition order so that lookup
+        #  tables can be plain sequences indexed with `index`.
+        self.index: int = len(type(self).__members__)
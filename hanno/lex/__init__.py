@@ -1,4 +1,4 @@
-from .eol_inference import can_add_eol, infer_eols
+from .eol_inference import can_add_eol, infer_eols, lex_with_eols
 from .main import lex, Token, TokenStream
 from .preprocessing import normalise_newlines, to_utf8
 from .tokens import TokenTypes
@@ -7,6 +7,7 @@ __all__ = (
     "can_add_eol",
     "infer_eols",
     "lex",
+    "lex_with_eols",
     "normalise_newlines",
     "Token",
     "TokenStream",
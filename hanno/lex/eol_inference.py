@@ -1,37 +1,68 @@
-from typing import Container, Optional, Iterator
+from operator import sub
+from typing import (
+    Collection,
+    Container,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+)
 
-from .main import Token, TokenStream
+from .main import generate_tokens, Token, TokenStream
 from .tokens import TokenTypes
 
-OPENING_PAIRS: Container[TokenTypes] = (TokenTypes.lbracket, TokenTypes.lparen)
-CLOSING_PAIRS: Container[TokenTypes] = (TokenTypes.rbracket, TokenTypes.rparen)
-
-VALID_STARTERS: Container[TokenTypes] = (
-    TokenTypes.bslash,
-    TokenTypes.end,
-    TokenTypes.dash,
-    TokenTypes.false,
-    TokenTypes.float_,
-    TokenTypes.if_,
-    TokenTypes.integer,
-    TokenTypes.lbracket,
-    TokenTypes.let,
-    TokenTypes.lparen,
-    TokenTypes.match,
-    TokenTypes.name,
-    TokenTypes.string,
-    TokenTypes.true,
+OPENING_PAIRS: FrozenSet[TokenTypes] = frozenset(
+    {TokenTypes.lbracket, TokenTypes.lparen}
+)
+CLOSING_PAIRS: FrozenSet[TokenTypes] = frozenset(
+    {TokenTypes.rbracket, TokenTypes.rparen}
+)
+
+VALID_STARTERS: FrozenSet[TokenTypes] = frozenset(
+    {
+        TokenTypes.bslash,
+        TokenTypes.end,
+        TokenTypes.dash,
+        TokenTypes.false,
+        TokenTypes.float_,
+        TokenTypes.if_,
+        TokenTypes.integer,
+        TokenTypes.lbracket,
+        TokenTypes.let,
+        TokenTypes.lparen,
+        TokenTypes.match,
+        TokenTypes.name,
+        TokenTypes.string,
+        TokenTypes.true,
+    }
+)
+VALID_ENDINGS: FrozenSet[TokenTypes] = frozenset(
+    {
+        TokenTypes.end,
+        TokenTypes.false,
+        TokenTypes.float_,
+        TokenTypes.integer,
+        TokenTypes.name,
+        TokenTypes.rbracket,
+        TokenTypes.rparen,
+        TokenTypes.string,
+        TokenTypes.true,
+    }
 )
-VALID_ENDINGS: Container[TokenTypes] = (
-    TokenTypes.end,
-    TokenTypes.false,
-    TokenTypes.float_,
-    TokenTypes.integer,
-    TokenTypes.name,
-    TokenTypes.rbracket,
-    TokenTypes.rparen,
-    TokenTypes.string,
-    TokenTypes.true,
+
+
+def _build_lookup_table(type_set: Collection[TokenTypes]) -> bytes:
+    table = bytearray(len(TokenTypes))
+    for type_ in type_set:
+        table[type_.index] = 1
+    return bytes(table)
+
+
+_starter_table: bytes = _build_lookup_table(VALID_STARTERS)
+_ending_table: bytes = _build_lookup_table(VALID_ENDINGS)
+_paren_deltas: Sequence[int] = tuple(
+    map(sub, _build_lookup_table(OPENING_PAIRS), _build_lookup_table(CLOSING_PAIRS))
 )
 
 
@@ -58,12 +89,13 @@ def can_add_eol(
     bool
         Whether to add an EOL token at the current position.
     """
-    return (
-        (paren_stack_size == 0)
-        and ("\n" in current.value)
-        and (prev.type_ in VALID_ENDINGS)
-        and (next_ is None or next_.type_ in VALID_STARTERS)
-    )
+    if paren_stack_size != 0:
+        return False
+    if not _ending_table[prev.type_.index]:
+        return False
+    if next_ is not None and not _starter_table[next_.type_.index]:
+        return False
+    return current.value is not None and "\n" in current.value
 
 
 def infer_eols(stream: TokenStream) -> TokenStream:
@@ -86,26 +118,74 @@ def infer_eols(stream: TokenStream) -> TokenStream:
         The stream with the inferred EOLs and with `whitespace`s
         stripped out.
     """
-    tokens = tuple(_infer(stream))
-    return TokenStream(tokens, ())
+    return TokenStream(_infer(stream), ())
+
+
+def lex_with_eols(
+    source: str, ignore: Container[TokenTypes] = (TokenTypes.comment,)
+) -> TokenStream:
+    """
+    Lex `source` and infer its EOLs in a single pass. This produces the
+    same stream as `infer_eols(lex(source, ignore))` without building
+    the intermediate stream of raw tokens.
+
+    Parameters
+    ----------
+    source: str
+        The string that will be lexed.
+    ignore: Container[TokenTypes]
+        The token types that shouldn't be exposed to the client. It
+        must not contain `whitespace`.
+
+    Returns
+    -------
+    TokenStream
+        The tokens that were generated, with the inferred EOLs and
+        with `whitespace`s stripped out.
+    """
+    return TokenStream(_infer(generate_tokens(source), ignore), ())
 
 
-def _infer(stream: TokenStream) -> Iterator[Token]:
+def _infer(tokens: Iterable[Token], ignore: Container[TokenTypes] = ()) -> List[Token]:
+    # NOTE: Whitespace is held back until the token after it arrives
+    #  since that token decides whether it becomes an EOL.
+    result: List[Token] = []
+    append = result.append
     paren_stack_size = 0
     prev_token = Token((0, 0), TokenTypes.eol, None)
-    for token in stream:
-        if token.type_ in OPENING_PAIRS:
-            paren_stack_size += 1
-        elif token.type_ in CLOSING_PAIRS:
-            paren_stack_size -= 1
-        elif token.type_ == TokenTypes.whitespace:
-            if not can_add_eol(prev_token, token, stream.preview(), paren_stack_size):
-                continue
-            token = Token(token.span, TokenTypes.eol, None)
+    pending: Optional[Token] = None
+    for token in tokens:
+        type_ = token.type_
+        if type_ == TokenTypes.whitespace:
+            pending = token
+            continue
+        if type_ in ignore:
+            continue
+
+        if pending is not None:
+            if can_add_eol(prev_token, pending, token, paren_stack_size):
+                prev_token = Token(pending.span, TokenTypes.eol, None)
+                append(prev_token)
+            pending = None
 
+        paren_stack_size += _paren_deltas[type_.index]
         prev_token = token
-        yield prev_token
+        append(token)
+
+    _add_final_eol(result, prev_token, pending, paren_stack_size)
+    return result
+
+
+def _add_final_eol(
+    result: List[Token],
+    prev_token: Token,
+    pending: Optional[Token],
+    paren_stack_size: int,
+) -> None:
+    if pending is not None and can_add_eol(prev_token, pending, None, paren_stack_size):
+        prev_token = Token(pending.span, TokenTypes.eol, None)
+        result.append(prev_token)
 
     if prev_token.type_ != TokenTypes.eol:
         prev_end = prev_token.span[1]
-        yield Token((prev_end, prev_end + 1), TokenTypes.eol, None)
+        result.append(Token((prev_end, prev_end + 1), TokenTypes.eol, None))
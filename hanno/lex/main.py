@@ -1,7 +1,14 @@
-from string import whitespace
+from dataclasses import dataclass
+from re import compile as re_compile, escape as re_escape, Match, Pattern
+from string import ascii_letters, digits, whitespace
+from sys import intern
 from typing import (
+    Callable,
     Container,
-    NamedTuple,
+    Dict,
+    FrozenSet,
+    Iterator,
+    Mapping,
     Optional,
     Sequence,
     Tuple,
@@ -21,15 +28,46 @@ from .tokens import (
     TokenTypes,
 )
 
-Token = NamedTuple(
-    "Token",
-    (("span", Tuple[int, int]), ("type_", TokenTypes), ("value", Optional[str])),
-)
 
+@dataclass(unsafe_hash=True)
+class Token:
+    """
+    A single lexeme from the source code. It should be treated as
+    immutable even though it isn't frozen since frozen dataclasses are
+    slower to create and the lexer makes one for every lexeme. Like the
+    `NamedTuple` it replaced, it compares and hashes by value.
+
+    Attributes
+    ----------
+    span: Tuple[int, int]
+        Where the lexeme starts and ends in the source code.
+    type_: TokenTypes
+        What kind of lexeme this is.
+    value: Optional[str]
+        The text of the lexeme, or `None` if `type_` already says
+        everything about it (like with keywords and operators).
+    """
+
+    __slots__ = ("span", "type_", "value")
+
+    span: Tuple[int, int]
+    type_: TokenTypes
+    value: Optional[str]
 
-DOUBLE_CHAR_VALUES: Container[str] = [type_.value for type_ in DOUBLE_CHAR_TOKENS]
-KEYWORD_VALUES: Container[str] = [type_.value for type_ in KEYWORDS]
-SINGLE_CHAR_VALUES: Container[str] = [type_.value for type_ in SINGLE_CHAR_TOKENS]
+
+# NOTE: `\d` matches what `str.isdecimal` does and `\w` matches `str.isalnum` plus `_`.
+_number_pattern: Pattern[str] = re_compile(r"\d+(\.\d*)?")
+_name_pattern: Pattern[str] = re_compile(r"\w+")
+_whitespace_pattern: Pattern[str] = re_compile(f"[{re_escape(whitespace)}]+")
+_whitespace_chars: FrozenSet[str] = frozenset(whitespace)
+
+DOUBLE_CHAR_VALUES: Mapping[str, TokenTypes] = {
+    type_.value: type_ for type_ in DOUBLE_CHAR_TOKENS
+}
+KEYWORD_VALUES: Mapping[str, TokenTypes] = {type_.value: type_ for type_ in KEYWORDS}
+SINGLE_CHAR_VALUES: Mapping[str, TokenTypes] = {
+    type_.value: type_ for type_ in SINGLE_CHAR_TOKENS
+}
 
 
 def lex(
@@ -50,160 +88,203 @@ def lex(
     TokenStream
         The tokens that were generated by lexing.
     """
-    stream = []
-    prev_end = 0
-    source_length = len(source)
-    while prev_end < source_length:
-        result = lex_word(source[prev_end:])
-        if result is None:
-            raise IllegalCharError((prev_end, prev_end + 1), source[prev_end])
+    return TokenStream(list(generate_tokens(source)), ignore)
 
-        token_type, value, length = result
-        start, prev_end = prev_end, prev_end + length
-        stream.append(Token((start, prev_end), token_type, value))
 
-    return TokenStream(stream, ignore)
+def generate_tokens(source: str) -> Iterator[Token]:
+    """
+    Lazily generate every token in `source`, including the ones that
+    the parser ignores like `comment` and `whitespace`.
+
+    Parameters
+    ----------
+    source: str
+        The string that will be lexed.
+
+    Returns
+    -------
+    Iterator[Token]
+        The tokens in the order that they appear in the source.
+    """
+    start = 0
+    source_length = len(source)
+    get_scanner = SCANNERS.get
+    while start < source_length:
+        token = get_scanner(source[start], lex_word)(source, start)
+        if token is None:
+            raise IllegalCharError((start, start + 1), source[start])
+
+        yield token
+        start = token.span[1]
 
 
-def lex_word(source: str) -> Optional[Tuple[TokenTypes, Optional[str], int]]:
-    """Create the data required to build a single lexeme."""
-    first = source[0]
+def lex_word(source: str, start: int) -> Optional[Token]:
+    """
+    Create the token for the single lexeme that begins at `start`, or
+    `None` if no lexeme can begin with that character.
+    """
+    first = source[start]
+    scanner = SCANNERS.get(first)
+    if scanner is not None:
+        return scanner(source, start)
+    # NOTE: Only non-ASCII chars get here, and the only non-ASCII
+    #  lexemes are numbers and names.
     if first.isdecimal():
-        return lex_number(source)
-    if first.isalnum() or first == "_":
-        return lex_name(source)
-    if first == '"':
-        return lex_string(source)
-    if source[:2] in DOUBLE_CHAR_VALUES:
-        return TokenTypes(source[:2]), None, 2
-    if first in SINGLE_CHAR_VALUES:
-        return TokenTypes(first), None, 1
-    if first == COMMENT_MARKER:
-        return lex_comment(source)
-    if first in whitespace:
-        return lex_whitespace(source)
+        return lex_number(source, start)
+    if first.isalnum():
+        return lex_name(source, start)
     return None
 
 
-def lex_comment(source: str) -> Tuple[TokenTypes, Optional[str], int]:
+def lex_comment(source: str, start: int) -> Token:
     """Lex a single line comment."""
-    max_index = len(source)
-    current_index = 0
-    while current_index < max_index and source[current_index] != "\n":
-        current_index += 1
-
-    current_index += 1 if current_index < max_index else 0
-    return TokenTypes.comment, source[:current_index], current_index
+    end = source.find("\n", start)
+    end = len(source) if end == -1 else end + 1
+    return Token((start, end), TokenTypes.comment, source[start:end])
 
 
-def lex_name(source: str) -> Tuple[TokenTypes, Optional[str], int]:
+def lex_name(source: str, start: int) -> Token:
     """
-    Parse the (truncated) source in order to create either a `name`
-    or a keyword token.
+    Parse the source in order to create either a `name` or a keyword
+    token.
 
     Parameters
     ---------
     source: str
         The source code that will be lexed.
+    start: int
+        Where the lexeme begins in `source`.
 
     Returns
     -------
-    Tuple[TokenTypes, Optional[str], int]
-        It is a tuple of either a keyword token type or
-        `TokenTypes.name`, then the actual name parsed (or `None` if
-        it's a keyword) and its length.
+    Token
+        Either a keyword token (which has no value) or a `name` or
+        `type_name` token holding the actual name parsed.
     """
-    max_index = len(source)
-    current_index = 0
-    current_char = source[current_index]
-    while current_char.isalnum() or current_char == "_":
-        current_index += 1
-        if current_index >= max_index:
-            break
-        current_char = source[current_index]
-
-    token_value = source[:current_index]
-    if token_value in KEYWORD_VALUES:
-        return TokenTypes(token_value), None, current_index
+    current_index = _name_pattern.match(source, start).end()  # type: ignore
+    token_value = source[start:current_index]
+    keyword = KEYWORD_VALUES.get(token_value)
+    if keyword is not None:
+        return Token((start, current_index), keyword, None)
+
+    token_value = intern(token_value)
     if token_value[0].isupper():
-        return TokenTypes.type_name, token_value, current_index
-    return TokenTypes.name, token_value, current_index
+        return Token((start, current_index), TokenTypes.type_name, token_value)
+    return Token((start, current_index), TokenTypes.name, token_value)
 
 
-def lex_string(source: str) -> Optional[Tuple[TokenTypes, Optional[str], int]]:
+def lex_string(source: str, start: int) -> Optional[Token]:
     """
-    Parse the (truncated) source in order to create a string token.
+    Parse the source in order to create a string token.
 
     Parameters
     ---------
     source: str
         The source code that will be lexed.
+    start: int
+        Where the opening quote is in `source`.
 
     Returns
     -------
-    Optional[Tuple[TokenTypes, str, int]]
+    Optional[Token]
         If it is `None`, then it was unable to parse the source. Else,
-        it is a tuple of (specifically) `TokenTypes.string`, then
-        the actual string parsed and its length.
+        it is a `string` token holding the actual string parsed.
     """
-    current_index = 1
-    in_escape = False
-    max_index = len(source)
-    while current_index < max_index:
-        if (not in_escape) and source[current_index] == '"':
-            break
-
-        in_escape = (not in_escape) if source[current_index] == "\\" else False
-        current_index += 1
-    else:
-        logger.critical(
-            "The stream unexpectedly ended before finding the end of the string."
-        )
-        return None
-
-    current_index += 1
-    return TokenTypes.string, source[:current_index], current_index
-
-
-def lex_number(source: str) -> Tuple[TokenTypes, Optional[str], int]:
+    current_index = start + 1
+    while True:
+        quote_index = source.find('"', current_index)
+        if quote_index == -1:
+            logger.critical(
+                "The stream unexpectedly ended before finding the end of the string."
+            )
+            return None
+
+        # NOTE: The quote is escaped only if it comes after an odd
+        #  number of backslashes.
+        slash_index = quote_index - 1
+        while source[slash_index] == "\\":
+            slash_index -= 1
+        current_index = quote_index + 1
+        if (quote_index - slash_index) % 2:
+            span = (start, current_index)
+            return Token(span, TokenTypes.string, source[start:current_index])
+
+
+def lex_number(source: str, start: int) -> Token:
     """
-    Parse the (truncated) source in order to create either an `integer`
-    or a `float_` token.
+    Parse the source in order to create either an `integer` or a
+    `float_` token.
 
     Parameters
     ---------
     source: str
         The source code that will be lexed.
+    start: int
+        Where the lexeme begins in `source`.
 
     Returns
     -------
-    Tuple[TokenTypes, str, int]
-        It is a tuple of (specifically) either `TokenTypes.integer` or
-        `TokenTypes.float_`, then the actual string parsed and its
-        length.
+    Token
+        Either an `integer` or a `float_` token holding the actual
+        string parsed.
     """
-    max_index = len(source)
-    current_index = 0
-    type_ = TokenTypes.integer
-    while current_index < max_index and source[current_index].isdecimal():
-        current_index += 1
+    match: Match[str] = _number_pattern.match(source, start)  # type: ignore
+    current_index = match.end()
+    type_ = TokenTypes.integer if match.start(1) == -1 else TokenTypes.float_
+    return Token((start, current_index), type_, source[start:current_index])
 
-    if current_index < max_index and source[current_index] == ".":
-        current_index += 1
-        type_ = TokenTypes.float_
-        while current_index < max_index and source[current_index].isdecimal():
-            current_index += 1
 
-    return type_, source[:current_index], current_index
+def lex_whitespace(source: str, start: int) -> Token:
+    """Lex either a `whitespace` or a `newline` token."""
+    current_index = start + 1
+    # NOTE: Most whitespace is a single char, which doesn't need the regex.
+    if source[current_index : current_index + 1] in _whitespace_chars:
+        current_index = _whitespace_pattern.match(source, start).end()  # type: ignore
+    span = (start, current_index)
+    return Token(span, TokenTypes.whitespace, source[start:current_index])
 
 
-def lex_whitespace(source: str) -> Tuple[TokenTypes, Optional[str], int]:
-    """Lex either a `whitespace` or a `newline` token."""
-    max_index = len(source)
-    current_index = 0
-    while current_index < max_index and source[current_index] in whitespace:
-        current_index += 1
-    return TokenTypes.whitespace, source[:current_index], current_index
+_Scanner = Callable[[str, int], Optional[Token]]
+
+
+def _make_single_char_scanner(type_: TokenTypes) -> _Scanner:
+    return lambda _, start: Token((start, start + 1), type_, None)
+
+
+def _make_symbol_scanner(first: str) -> _Scanner:
+    second_chars = {
+        type_.value[1]: type_ for type_ in DOUBLE_CHAR_TOKENS if type_.value[0] == first
+    }
+    get_double = second_chars.get
+    single = SINGLE_CHAR_VALUES.get(first)
+
+    def scanner(source: str, start: int) -> Optional[Token]:
+        double = get_double(source[start + 1 : start + 2])
+        if double is not None:
+            return Token((start, start + 2), double, None)
+        return None if single is None else Token((start, start + 1), single, None)
+
+    return scanner
+
+
+def _build_scanner_table() -> Mapping[str, _Scanner]:
+    table: Dict[str, _Scanner] = {}
+    for char in ascii_letters + "_":
+        table[char] = lex_name
+    for type_ in SINGLE_CHAR_TOKENS:
+        table[type_.value] = _make_single_char_scanner(type_)
+    for type_ in DOUBLE_CHAR_TOKENS:
+        table[type_.value[0]] = _make_symbol_scanner(type_.value[0])
+    for char in whitespace:
+        table[char] = lex_whitespace
+    for char in digits:
+        table[char] = lex_number
+    table['"'] = lex_string
+    table[COMMENT_MARKER] = lex_comment
+    return table
+
+
+SCANNERS: Mapping[str, _Scanner] = _build_scanner_table()
 
 
 class TokenStream:
@@ -212,18 +293,27 @@ class TokenStream:
     already computed elements and integrate with the parser which
     expects an eager lexer.
 
+    Attributes
+    ----------
+    current_type: Optional[TokenTypes]
+        The type of the token at the head of the stream or `None` if
+        the stream is empty. Checking this directly is cheaper than
+        calling `peek` with a single token type.
+
     Warnings
     --------
     - This class contains a lot of mutable state so the best way to use
       it is by having a separate copy for each thread.
     """
 
-    __slots__ = ("_index", "_tokens", "ignore")
+    __slots__ = ("_index", "_tokens", "current_type", "ignore")
 
     def __init__(self, tokens: Sequence[Token], ignore: Container[TokenTypes]) -> None:
         self._index: int = 0
         self._tokens: Sequence[Token] = tokens
         self.ignore: Container[TokenTypes] = ignore
+        self.current_type: Optional[TokenTypes] = None
+        self._skip_ignored()
 
     def consume(self, *expected: TokenTypes) -> Token:
         """
@@ -264,8 +354,8 @@ class TokenStream:
         bool
             Whether `expected` was found at the front of the stream.
         """
-        if self.peek(*expected):
-            self.consume(*expected)
+        if self.current_type in expected:
+            self.next()
             return True
         return False
 
@@ -283,13 +373,12 @@ class TokenStream:
         Token
             The token at the head of the stream.
         """
-        try:
-            token = self._tokens[self._index]
-        except IndexError as error:
-            raise UnexpectedEOFError() from error
-        else:
-            self._index += 1
-            return self.next() if token.type_ in self.ignore else token
+        if self.current_type is None:
+            raise UnexpectedEOFError()
+        token = self._tokens[self._index]
+        self._index += 1
+        self._skip_ignored()
+        return token
 
     def peek(self, *expected: TokenTypes) -> bool:
         """
@@ -311,8 +400,7 @@ class TokenStream:
         bool
             Whether `expected` was found at the front of the stream.
         """
-        token = self.preview()
-        return token is not None and token.type_ in expected
+        return self.current_type in expected
 
     def preview(self) -> Optional[Token]:
         """
@@ -324,12 +412,7 @@ class TokenStream:
         Token
             The token at the head of the stream.
         """
-        try:
-            head = self.next()
-            self._index -= 1
-            return head
-        except UnexpectedEOFError:
-            return None
+        return None if self.current_type is None else self._tokens[self._index]
 
     def show(self, sep: str = "\n") -> str:
         """Pretty print the tokens contained."""
@@ -344,11 +427,25 @@ class TokenStream:
 
         return sep.join(parts)
 
+    def _skip_ignored(self) -> None:
+        # NOTE: The index is always left on a token that isn't ignored
+        #  so that `current_type`, `peek` and `preview` never have to
+        #  search ahead for the head of the stream.
+        tokens, ignore = self._tokens, self.ignore
+        index, length = self._index, len(tokens)
+        while index < length:
+            type_ = tokens[index].type_
+            if type_ not in ignore:
+                self._index, self.current_type = index, type_
+                return
+            index += 1
+        self._index, self.current_type = length, None
+
     def __bool__(self):
-        return self.preview() is not None
+        return self.current_type is not None
 
     def __iter__(self):
-        while self:
+        while self.current_type is not None:
             yield self.next()
 
     def __next__(self):
@@ -36,14 +36,7 @@ def try_filesys_encoding(source, _):
     """
     fs_encoding = getfilesystemencoding()
     try:
-        return source.decode(fs_encoding).encode("utf-8").decode("utf-8")
-    except UnicodeEncodeError:
-        logger.exception(
-            "Unable to convert the source into UTF-8 bytes from a %s string.",
-            fs_encoding,
-            exc_info=True,
-        )
-        return None
+        return source.decode(fs_encoding)
     except UnicodeDecodeError as error:
         logger.exception(
             "Unable to convert the source into a UTF-8 string from %s bytes.",
@@ -82,10 +75,7 @@ def to_utf8(
     """
     try:
         encoding = "utf-8" if encoding is None else lookup(encoding).name
-        result = (
-            source if encoding == "utf-8" else source.decode(encoding).encode(encoding)
-        )
-        result_string = result.decode("utf-8")
+        result_string = source.decode(encoding)
     except UnicodeError as error:
         logger.exception(
             (
@@ -138,6 +128,10 @@ def normalise_newlines(
     str
         The source code with normalised newline formats.
     """
+    # NOTE: Every newline type apart from "\n" has a "\r" in it.
+    if "\r" not in source:
+        return source
+
     for type_ in ALL_NEWLINE_TYPES:
         if type_ == "\n":
             continue
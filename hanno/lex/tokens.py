@@ -1,11 +1,13 @@
-from enum import Enum, unique
+from enum import unique
 from typing import Collection, Container
 
+from indexed_enum import IndexedEnum
+
 COMMENT_MARKER: str = "#"
 
 
 @unique
-class TokenTypes(Enum):
+class TokenTypes(IndexedEnum):
     """
     All the possible types that a token from the default lexer can have
     """
@@ -1,38 +1,63 @@
-from typing import Callable, List, Mapping, Optional, Tuple
+from typing import (
+    Callable,
+    FrozenSet,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
 
 from asts import base, types
 from errors import merge, UnexpectedEOFError, UnexpectedTokenError
-from lex import TokenStream, TokenTypes
+from lex import Token, TokenStream, TokenTypes
 from log import logger
 
 PrefixParser = Callable[[TokenStream], base.ASTNode]
 InfixParser = Callable[[TokenStream, base.ASTNode], base.ASTNode]
+ScalarBuilder = Callable[[Token], base.Scalar]
+LeafBuilder = Callable[[Token], base.ASTNode]
+_Node = TypeVar("_Node", bound=base.ASTNode)
+_TableValue = TypeVar("_TableValue")
 
 MAX_APPLICATIONS = 24
-SCALAR_TOKENS = (
-    TokenTypes.false,
-    TokenTypes.float_,
-    TokenTypes.integer,
-    TokenTypes.string,
-    TokenTypes.true,
+SCALAR_TOKENS: FrozenSet[TokenTypes] = frozenset(
+    {
+        TokenTypes.false,
+        TokenTypes.float_,
+        TokenTypes.integer,
+        TokenTypes.string,
+        TokenTypes.true,
+    }
 )
+DEFINE_OPERATORS: Sequence[TokenTypes] = (TokenTypes.colon_equal, TokenTypes.equal)
+FACTOR_TOKENS: FrozenSet[TokenTypes] = SCALAR_TOKENS | {
+    TokenTypes.lbracket,
+    TokenTypes.lparen,
+    TokenTypes.name,
+}
 
 
-def _infix_op(token_type: TokenTypes, right_associative: bool = False) -> InfixParser:
-    precedence = precedence_table[token_type] - int(right_associative)
+def _fold_right(
+    items: List[_Node], build: Callable[[base.Span, _Node, _Node], _Node]
+) -> _Node:
+    """
+    Nest `items` to the right so that `[a, b, c]` becomes
+    `build(a, build(b, c))`. This lets right associative constructs be
+    parsed with a loop instead of recursing once per item.
+    """
+    result = items[-1]
+    for item in reversed(items[:-1]):
+        result = build((item.span[0], result.span[1]), item, result)
+    return result
 
-    def inner(stream: TokenStream, left: base.ASTNode) -> base.Apply:
-        op = stream.consume(token_type)
-        right = parse_expr(stream, precedence)
-        return base.Apply(
-            merge(left.span, right.span),
-            base.Apply(
-                merge(left.span, op.span), base.Name(op.span, token_type.value), left
-            ),
-            right,
-        )
 
-    return inner
+def _text(token: Token) -> str:
+    """Get the text of a token whose type always comes with a value."""
+    if token.value is None:
+        raise UnexpectedTokenError(token)
+    return token.value
 
 
 def parse_annotation(stream: TokenStream, left: base.ASTNode) -> base.Annotation:
@@ -47,19 +72,17 @@ def parse_annotation(stream: TokenStream, left: base.ASTNode) -> base.Annotation
 def parse_apply(stream: TokenStream) -> base.ASTNode:
     iterations = 0
     result = parse_factor(stream)
+    start = result.span[0]
     while MAX_APPLICATIONS > iterations:
-        try:
-            iterations += 1
-            arg = parse_factor(stream)
-            return base.Apply(merge(result.span, arg.span), result, arg)
-        except UnexpectedTokenError as error:
-            logger.warning(
-                "Ignored an UnexpectedTokenError with %s where %s was expected.",
-                error.found_type,
-                error.expected,
-            )
+        # NOTE: Peeking is much cheaper than catching `parse_factor`'s error.
+        type_ = stream.current_type
+        if type_ is None or not _factor_tokens[type_.index]:
             return result
 
+        iterations += 1
+        arg = parse_factor(stream)
+        result = base.Apply((start, arg.span[1]), result, arg)
+
     logger.warning(
         "Exiting `parse_apply` because we have exceeded the maximum allowed "
         "number of function applications."
@@ -72,29 +95,28 @@ def parse_block(stream: TokenStream, *expected_ends: TokenTypes) -> base.ASTNode
         raise ValueError("This function requires at least 1 expected `TokenTypes`.")
 
     exprs: List[base.ASTNode] = []
-    while stream and not stream.consume_if(*expected_ends):
-        exprs.append(parse_expr(stream, 0))
-        stream.consume(TokenTypes.eol)
+    append, consume, consume_if = exprs.append, stream.consume, stream.consume_if
+    while stream and not consume_if(*expected_ends):
+        append(parse_expr(stream, 0))
+        consume(TokenTypes.eol)
 
     if not (stream or exprs):
         next_token = stream.preview()
         return base.Unit((0, 0) if next_token is None else next_token.span)
     if len(exprs) == 1:
         return exprs[0]
-    return base.Block(merge(exprs[0].span, exprs[-1].span), exprs)
+    return base.Block((exprs[0].span[0], exprs[-1].span[1]), exprs)
 
 
 def parse_define(stream: TokenStream) -> base.Define:
     first = stream.consume(TokenTypes.let)
     target: base.Pattern
     param: Optional[base.Pattern] = None
-    if stream.peek(TokenTypes.name):
-        token = stream.consume(TokenTypes.name)
-        target = base.FreeName(token.span, token.value)
+    if stream.current_type == TokenTypes.name:
+        token = stream.next()
+        target = base.FreeName(token.span, _text(token))
         param = (
-            None
-            if stream.peek(TokenTypes.colon_equal, TokenTypes.equal)
-            else parse_pattern(stream)
+            None if stream.current_type in DEFINE_OPERATORS else parse_pattern(stream)
         )
     else:
         target = parse_pattern(stream)
@@ -103,7 +125,7 @@ def parse_define(stream: TokenStream) -> base.Define:
         value = parse_block(stream, TokenTypes.end)
     else:
         stream.consume(TokenTypes.equal)
-        value = parse_expr(stream, precedence_table[TokenTypes.let])
+        value = parse_expr(stream, _LET_PRECEDENCE)
 
     span = merge(first.span, value.span)
     if param is None:
@@ -116,31 +138,40 @@ def parse_define(stream: TokenStream) -> base.Define:
 
 
 def parse_factor(stream: TokenStream) -> base.ASTNode:
-    if stream.peek(TokenTypes.lparen):
-        return parse_group(stream)
-    if stream.peek(TokenTypes.lbracket):
-        return parse_list(stream)
-    if stream.peek(TokenTypes.name):
-        token = stream.consume(TokenTypes.name)
-        return base.Name(token.span, token.value)
-    return parse_scalar(stream)
+    type_ = stream.current_type
+    if type_ is None:
+        raise UnexpectedEOFError()
+
+    type_index = type_.index
+    leaf_builder = _leaf_builders[type_index]
+    if leaf_builder is not None:
+        return leaf_builder(stream.next())
 
+    factor_parser = _factor_parsers[type_index]
+    if factor_parser is None:
+        raise UnexpectedTokenError(stream.preview())
+    return factor_parser(stream)
 
-def parse_factor_pattern(stream: TokenStream) -> Optional[base.Pattern]:
-    if stream.peek(TokenTypes.lbracket):
+
+def parse_factor_pattern(stream: TokenStream) -> base.Pattern:
+    type_ = stream.current_type
+    if type_ == TokenTypes.lbracket:
         return parse_list_pattern(stream)
-    if stream.peek(*SCALAR_TOKENS):
+    if type_ in SCALAR_TOKENS:
         node = parse_scalar(stream)
         return base.ScalarPattern(node.span, node.value)
-    if stream.peek(TokenTypes.name):
-        token = stream.consume(TokenTypes.name)
-        return base.FreeName(token.span, token.value)
-    if stream.consume_if(TokenTypes.caret):
+    if type_ == TokenTypes.name:
+        token = stream.next()
+        return base.FreeName(token.span, _text(token))
+    if type_ == TokenTypes.caret:
+        stream.next()
         token = stream.consume(TokenTypes.name)
-        return base.PinnedName(token.span, token.value)
-    if stream.peek(TokenTypes.lparen):
-        first = stream.consume(TokenTypes.lparen)
-        pattern = None if stream.peek(TokenTypes.rparen) else parse_pattern(stream)
+        return base.PinnedName(token.span, _text(token))
+    if type_ == TokenTypes.lparen:
+        first = stream.next()
+        pattern = (
+            None if stream.current_type == TokenTypes.rparen else parse_pattern(stream)
+        )
         last = stream.consume(TokenTypes.rparen)
         return pattern or base.UnitPattern(merge(first.span, last.span))
     raise UnexpectedTokenError(stream.preview())
@@ -150,19 +181,19 @@ def parse_func(stream: TokenStream) -> base.ASTNode:
     first = stream.consume(TokenTypes.bslash)
     param = parse_pattern(stream)
     stream.consume(TokenTypes.arrow)
-    body = parse_expr(stream, precedence_table[TokenTypes.bslash])
+    body = parse_expr(stream, _FUNC_PRECEDENCE)
     return base.Function(merge(first.span, body.span), param, body)
 
 
 def parse_generic_type(stream: TokenStream) -> types.Type:
-    if stream.peek(TokenTypes.name):
-        token = stream.consume(TokenTypes.name)
-        return types.TypeVar(token.span, token.value)
+    if stream.current_type == TokenTypes.name:
+        token = stream.next()
+        return types.TypeVar(token.span, _text(token))
 
     token = stream.consume(TokenTypes.type_name)
-    result = types.TypeName(token.span, token.value)
+    result: types.Type = types.TypeName(token.span, _text(token))
     if stream.consume_if(TokenTypes.lbracket):
-        while not stream.peek(TokenTypes.rbracket):
+        while stream.current_type != TokenTypes.rbracket:
             arg = parse_group_type(stream)
             result = types.TypeApply(merge(result.span, arg.span), result, arg)
             if not stream.consume_if(TokenTypes.comma):
@@ -173,19 +204,19 @@ def parse_generic_type(stream: TokenStream) -> types.Type:
 
 def parse_group(stream: TokenStream) -> base.ASTNode:
     first = stream.consume(TokenTypes.lparen)
-    if stream.peek(TokenTypes.rparen):
-        last = stream.consume(TokenTypes.rparen)
+    if stream.current_type == TokenTypes.rparen:
+        last = stream.next()
         return base.Unit(merge(first.span, last.span))
 
-    expr = parse_expr(stream, precedence_table[TokenTypes.let] + 1)
+    expr = parse_expr(stream, _LET_PRECEDENCE + 1)
     stream.consume(TokenTypes.rparen)
     return expr
 
 
 def parse_group_pattern(stream: TokenStream) -> base.Pattern:
     first = stream.consume(TokenTypes.lparen)
-    if stream.peek(TokenTypes.rparen):
-        last = stream.consume(TokenTypes.rparen)
+    if stream.current_type == TokenTypes.rparen:
+        last = stream.next()
         return base.UnitPattern(merge(first.span, last.span))
 
     pattern = parse_pattern(stream)
@@ -203,20 +234,21 @@ def parse_group_type(stream: TokenStream) -> types.Type:
 
 def parse_if(stream: TokenStream) -> base.ASTNode:
     first = stream.consume(TokenTypes.if_)
-    pred = parse_expr(stream, precedence_table[TokenTypes.if_])
+    pred = parse_expr(stream, _IF_PRECEDENCE)
     stream.consume(TokenTypes.then)
-    cons = parse_expr(stream, precedence_table[TokenTypes.if_])
+    cons = parse_expr(stream, _IF_PRECEDENCE)
     stream.consume(TokenTypes.else_)
-    else_ = parse_expr(stream, precedence_table[TokenTypes.if_])
+    else_ = parse_expr(stream, _IF_PRECEDENCE)
     return base.Cond(merge(first.span, else_.span), pred, cons, else_)
 
 
 def parse_list(stream: TokenStream) -> base.ASTNode:
     first = stream.consume(TokenTypes.lbracket)
     elements: List[base.ASTNode] = []
-    while not stream.peek(TokenTypes.rbracket):
-        elements.append(parse_expr(stream, precedence_table[TokenTypes.comma]))
-        if not stream.consume_if(TokenTypes.comma):
+    append, consume_if = elements.append, stream.consume_if
+    while stream.current_type != TokenTypes.rbracket:
+        append(parse_expr(stream, _COMMA_PRECEDENCE))
+        if not consume_if(TokenTypes.comma):
             break
 
     last = stream.consume(TokenTypes.rbracket)
@@ -227,14 +259,15 @@ def parse_list_pattern(stream: TokenStream) -> base.ListPattern:
     first = stream.consume(TokenTypes.lbracket)
     rest: Optional[base.FreeName] = None
     initials: List[base.Pattern] = []
-    while not stream.peek(TokenTypes.rbracket):
-        if stream.consume_if(TokenTypes.ellipsis):
+    append, consume_if = initials.append, stream.consume_if
+    while stream.current_type != TokenTypes.rbracket:
+        if consume_if(TokenTypes.ellipsis):
             name_token = stream.consume(TokenTypes.name)
-            rest = base.FreeName(name_token.span, name_token.value)
+            rest = base.FreeName(name_token.span, _text(name_token))
             break
 
-        initials.append(parse_factor_pattern(stream))
-        if not stream.consume_if(TokenTypes.comma):
+        append(parse_factor_pattern(stream))
+        if not consume_if(TokenTypes.comma):
             break
 
     last = stream.consume(TokenTypes.rbracket)
@@ -243,13 +276,12 @@ def parse_list_pattern(stream: TokenStream) -> base.ListPattern:
 
 def parse_match(stream: TokenStream) -> base.Match:
     first = stream.consume(TokenTypes.match)
-    precedence = precedence_table[TokenTypes.match]
-    subject = parse_expr(stream, precedence)
+    subject = parse_expr(stream, _MATCH_PRECEDENCE)
     cases: List[Tuple[base.Pattern, base.ASTNode]] = []
     while stream.consume_if(TokenTypes.pipe):
         pred = parse_pattern(stream)
         stream.consume(TokenTypes.arrow)
-        cons = parse_expr(stream, precedence)
+        cons = parse_expr(stream, _MATCH_PRECEDENCE)
         cases.append((pred, cons))
 
     if cases:
@@ -259,58 +291,48 @@ def parse_match(stream: TokenStream) -> base.Match:
 
 def parse_negate(stream: TokenStream) -> base.Apply:
     token = stream.consume(TokenTypes.dash)
-    operand = parse_expr(stream, precedence_table[TokenTypes.tilde])
-    return base.Apply(
-        merge(token.span, operand.span), base.Name(token.span, "~"), operand
-    )
+    operand = parse_expr(stream, _NEGATE_PRECEDENCE)
+    return base.Apply(merge(token.span, operand.span), _operator_names["~"], operand)
 
 
 def parse_pair(stream: TokenStream, left: base.ASTNode) -> base.ASTNode:
     stream.consume(TokenTypes.comma)
-    right = parse_expr(stream, precedence_table[TokenTypes.comma] - 1)
-    return base.Pair(merge(left.span, right.span), left, right)
+    elements = [left, parse_expr(stream, _COMMA_PRECEDENCE)]
+    while stream.consume_if(TokenTypes.comma):
+        elements.append(parse_expr(stream, _COMMA_PRECEDENCE))
+    return _fold_right(elements, base.Pair)
 
 
 def parse_pair_type(stream: TokenStream) -> types.Type:
-    left = parse_group_type(stream)
-    if stream.consume_if(TokenTypes.comma):
-        right = parse_pair_type(stream)
-        return types.TypeApply.pair(merge(left.span, right.span), left, right)
-    return left
+    elements = [parse_group_type(stream)]
+    while stream.consume_if(TokenTypes.comma):
+        elements.append(parse_group_type(stream))
+    return _fold_right(elements, types.TypeApply.pair)
 
 
 def parse_pattern(stream: TokenStream) -> base.Pattern:
-    left = parse_factor_pattern(stream)
-    if stream.consume_if(TokenTypes.comma):
-        right = parse_pattern(stream)
-        return base.PairPattern(merge(left.span, right.span), left, right)
-    return left
+    elements = [parse_factor_pattern(stream)]
+    while stream.consume_if(TokenTypes.comma):
+        elements.append(parse_factor_pattern(stream))
+    return _fold_right(elements, base.PairPattern)
 
 
 def parse_scalar(stream: TokenStream) -> base.Scalar:
-    token = stream.preview()
-    if stream.consume_if(TokenTypes.false):
-        return base.Scalar(token.span, False)
-    if token.type_ == TokenTypes.float_:
-        stream.next()
-        return base.Scalar(token.span, float(token.value))
-    if token.type_ == TokenTypes.integer:
-        stream.next()
-        return base.Scalar(token.span, int(token.value))
-    if token.type_ == TokenTypes.string:
-        stream.next()
-        return base.Scalar(token.span, token.value[1:-1])
-    if stream.consume_if(TokenTypes.true):
-        return base.Scalar(token.span, True)
-    raise UnexpectedTokenError(token)
+    type_ = stream.current_type
+    if type_ is None:
+        raise UnexpectedEOFError()
+
+    builder = _scalar_builders[type_.index]
+    if builder is None:
+        raise UnexpectedTokenError(stream.preview())
+    return builder(stream.next())
 
 
 def parse_type(stream: TokenStream) -> types.Type:
-    left = parse_pair_type(stream)
-    if stream.consume_if(TokenTypes.arrow):
-        right = parse_type(stream)
-        return types.TypeApply.func(merge(left.span, right.span), left, right)
-    return left
+    elements = [parse_pair_type(stream)]
+    while stream.consume_if(TokenTypes.arrow):
+        elements.append(parse_pair_type(stream))
+    return _fold_right(elements, types.TypeApply.func)
 
 
 precedence_table: Mapping[TokenTypes, int] = {
@@ -338,6 +360,12 @@ precedence_table: Mapping[TokenTypes, int] = {
     TokenTypes.tilde: 120,
     TokenTypes.lparen: 130,
 }
+_COMMA_PRECEDENCE: int = precedence_table[TokenTypes.comma]
+_FUNC_PRECEDENCE: int = precedence_table[TokenTypes.bslash]
+_IF_PRECEDENCE: int = precedence_table[TokenTypes.if_]
+_LET_PRECEDENCE: int = precedence_table[TokenTypes.let]
+_MATCH_PRECEDENCE: int = precedence_table[TokenTypes.match]
+_NEGATE_PRECEDENCE: int = precedence_table[TokenTypes.tilde]
 
 prefix_parsers: Mapping[TokenTypes, PrefixParser] = {
     TokenTypes.if_: parse_if,
@@ -346,46 +374,122 @@ prefix_parsers: Mapping[TokenTypes, PrefixParser] = {
     TokenTypes.dash: parse_negate,
     TokenTypes.match: parse_match,
 }
+scalar_builders: Mapping[TokenTypes, ScalarBuilder] = {
+    TokenTypes.false: lambda token: base.Scalar(token.span, False),
+    TokenTypes.float_: lambda token: base.Scalar(token.span, float(_text(token))),
+    TokenTypes.integer: lambda token: base.Scalar(token.span, int(_text(token))),
+    TokenTypes.string: lambda token: base.Scalar(token.span, _text(token)[1:-1]),
+    TokenTypes.true: lambda token: base.Scalar(token.span, True),
+}
+# NOTE: The values are whether each operator is right associative.
+binary_operators: Mapping[TokenTypes, bool] = {
+    TokenTypes.and_: False,
+    TokenTypes.or_: False,
+    TokenTypes.greater: False,
+    TokenTypes.less: False,
+    TokenTypes.greater_equal: False,
+    TokenTypes.less_equal: False,
+    TokenTypes.equal: False,
+    TokenTypes.fslash_equal: False,
+    TokenTypes.plus: False,
+    TokenTypes.dash: False,
+    TokenTypes.diamond: False,
+    TokenTypes.fslash: True,
+    TokenTypes.asterisk: False,
+    TokenTypes.percent: False,
+    TokenTypes.caret: False,
+}
+factor_parsers: Mapping[TokenTypes, PrefixParser] = {
+    TokenTypes.lbracket: parse_list,
+    TokenTypes.lparen: parse_group,
+}
 infix_parsers: Mapping[TokenTypes, InfixParser] = {
-    TokenTypes.and_: _infix_op(TokenTypes.and_),
-    TokenTypes.or_: _infix_op(TokenTypes.or_),
-    TokenTypes.greater: _infix_op(TokenTypes.greater),
-    TokenTypes.less: _infix_op(TokenTypes.less),
-    TokenTypes.greater_equal: _infix_op(TokenTypes.greater_equal),
-    TokenTypes.less_equal: _infix_op(TokenTypes.less_equal),
-    TokenTypes.equal: _infix_op(TokenTypes.equal),
-    TokenTypes.fslash_equal: _infix_op(TokenTypes.fslash_equal),
-    TokenTypes.plus: _infix_op(TokenTypes.plus),
-    TokenTypes.dash: _infix_op(TokenTypes.dash),
-    TokenTypes.diamond: _infix_op(TokenTypes.diamond),
-    TokenTypes.fslash: _infix_op(TokenTypes.fslash, right_associative=True),
-    TokenTypes.asterisk: _infix_op(TokenTypes.asterisk),
-    TokenTypes.percent: _infix_op(TokenTypes.percent),
-    TokenTypes.caret: _infix_op(TokenTypes.caret),
     TokenTypes.comma: parse_pair,
     TokenTypes.double_colon: parse_annotation,
 }
 
 
-def parse_expr(stream: TokenStream, precedence: int = -10) -> base.ASTNode:
-    first_token = stream.preview()
-    if not stream:
-        raise UnexpectedEOFError()
-    if first_token is None:
-        raise UnexpectedTokenError(first_token)
+def _build_table(
+    mapping: Mapping[TokenTypes, _TableValue], default: _TableValue
+) -> Sequence[_TableValue]:
+    table = [default] * len(TokenTypes)
+    for type_, value in mapping.items():
+        table[type_.index] = value
+    return tuple(table)
 
-    prefix_parser = prefix_parsers.get(first_token.type_, parse_apply)
-    result = prefix_parser(stream)
 
-    op = stream.preview()
-    while op is not None and precedence_table.get(op.type_, -10) > precedence:
-        infix_parser = infix_parsers.get(op.type_)
-        if infix_parser is None:
-            break
+_precedences: Sequence[int] = _build_table(precedence_table, -10)
+_prefix_parsers: Sequence[PrefixParser] = _build_table(prefix_parsers, parse_apply)
+_infix_parsers: Sequence[Optional[InfixParser]] = _build_table(infix_parsers, None)
+# NOTE: The `Apply` around each operator carries its span, so the names can be shared.
+_operator_names: Mapping[str, base.Name] = {
+    op: base.Name((0, 0), op)
+    for op in (*(type_.value for type_ in binary_operators), "~")
+}
+_binary_operators: Sequence[Optional[Tuple[base.Name, int]]] = _build_table(
+    {
+        type_: (
+            _operator_names[type_.value],
+            precedence_table[type_] - int(right_associative),
+        )
+        for type_, right_associative in binary_operators.items()
+    },
+    None,
+)
+_scalar_builders: Sequence[Optional[ScalarBuilder]] = _build_table(
+    scalar_builders, None
+)
+_leaf_builders: Sequence[Optional[LeafBuilder]] = _build_table(
+    {
+        **scalar_builders,
+        TokenTypes.name: lambda token: base.Name(token.span, token.value),
+    },
+    None,
+)
+_factor_parsers: Sequence[Optional[PrefixParser]] = _build_table(factor_parsers, None)
+_factor_tokens: Sequence[bool] = _build_table(dict.fromkeys(FACTOR_TOKENS, True), False)
 
-        result = infix_parser(stream, result)
-        op = stream.preview()
-    return result
+
+def parse_expr(stream: TokenStream, precedence: int = -10) -> base.ASTNode:
+    # NOTE: The right operands of binary operators are parsed by this
+    #  same loop instead of a recursive call. Each pending left operand
+    #  waits on `pending` with its operator and the precedence to go
+    #  back to, so long chains like `a / b / c / ...` don't use up a
+    #  stack frame per operator.
+    pending: List[Tuple[base.ASTNode, Token, base.Name, int]] = []
+    while True:
+        first_type = stream.current_type
+        if first_type is None:
+            raise UnexpectedEOFError()
+
+        result = _prefix_parsers[first_type.index](stream)
+        op_type = stream.current_type
+        while True:
+            op_index = -1 if op_type is None else op_type.index
+            if op_index >= 0 and _precedences[op_index] > precedence:
+                binary_operator = _binary_operators[op_index]
+                if binary_operator is not None:
+                    op_name, right_precedence = binary_operator
+                    pending.append((result, stream.next(), op_name, precedence))
+                    precedence = right_precedence
+                    break
+
+                infix_parser = _infix_parsers[op_index]
+                if infix_parser is not None:
+                    result = infix_parser(stream, result)
+                    op_type = stream.current_type
+                    continue
+
+            if not pending:
+                return result
+
+            left, op, op_name, precedence = pending.pop()
+            start = left.span[0]
+            result = base.Apply(
+                (start, result.span[1]),
+                base.Apply((start, op.span[1]), op_name, left),
+                result,
+            )
 
 
 def parse(stream: TokenStream) -> base.ASTNode:
@@ -403,16 +507,13 @@ def parse(stream: TokenStream) -> base.ASTNode:
         The program in AST format.
     """
     exprs: List[base.ASTNode] = []
+    append, consume = exprs.append, stream.consume
     while stream:
-        exprs.append(parse_expr(stream))
-        stream.consume(TokenTypes.eol)
-
-    return (
-        base.Unit((0, 0))
-        if not exprs
-        else (
-            exprs[0]
-            if len(exprs) == 1
-            else base.Block(merge(exprs[0].span, exprs[-1].span), exprs)
-        )
-    )
+        append(parse_expr(stream))
+        consume(TokenTypes.eol)
+
+    if not exprs:
+        return base.Unit((0, 0))
+    if len(exprs) == 1:
+        return exprs[0]
+    return base.Block((exprs[0].span[0], exprs[-1].span[1]), exprs)
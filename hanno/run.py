@@ -6,7 +6,7 @@ from asts import base, typed
 from codegen import simplify, to_bytecode
 from errors import CMDError, CMDErrorReasons, CompilerError, FatalInternalError
 from format import ASTPrinter, TypedASTPrinter
-from lex import infer_eols, lex, normalise_newlines, to_utf8, TokenStream
+from lex import lex_with_eols, normalise_newlines, to_utf8, TokenStream
 from log import logger
 from parse import parse
 from type_inference import infer_types
@@ -48,7 +48,7 @@ def get_version() -> Tuple[int, str]:
 
 def run_lexing(source: str, config: ConfigData) -> TokenStream:
     """Perform the lexing portion of the compiler."""
-    stream = infer_eols(lex(normalise_newlines(source)))
+    stream = lex_with_eols(normalise_newlines(source))
     if config.show_tokens:
         raise _FakeMessageException(stream.show())
     return stream
@@ -58,7 +58,7 @@ def run_parsing(source: TokenStream, config: ConfigData) -> base.ASTNode:
     """Perform the parsing portion of the compiler."""
     ast = string_expander.expand_strings(parse(source))
     if config.show_ast:
-        raise _FakeMessageException(ASTPrinter().run(ast))
+        raise _FakeMessageException(ASTPrinter().show(ast))
     return ast
 
 
@@ -70,7 +70,7 @@ def run_type_inference(source: base.ASTNode, config: ConfigData) -> typed.TypedA
     typed_ast = infer_types(source)
     if config.show_types:
         printer = TypedASTPrinter()
-        raise _FakeMessageException(printer.run(typed_ast))
+        raise _FakeMessageException(printer.show(typed_ast))
     return typed_ast
 
 
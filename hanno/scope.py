@@ -6,6 +6,7 @@ from typing import (
     NamedTuple,
     Optional,
     Protocol,
+    Sequence,
     Tuple,
     TypeVar,
 )
@@ -32,14 +33,23 @@ class Scope(Generic[ValType]):
     _data: Dict[str, ASTNode]
         A `dict` containing those names in string form and their values
         without the values being evaluated.
+    _maps: Tuple[Dict[str, ValType], ...]
+        The `_data` of this scope followed by those of all its
+        ancestors, innermost first. Lookups loop over this instead of
+        following `_parent` up the hierarchy.
     parent: Optional[Scope]
         A scope that wraps around `self` and can be requested for
         names that were defined before `self` was made.
     """
 
+    __slots__ = ("_data", "_maps", "_parent")
+
     def __init__(self, parent: Optional["Scope[ValType]"]) -> None:
         self._data: Dict[str, ValType] = {}
         self._parent: Optional[Scope[ValType]] = parent
+        self._maps: Tuple[Dict[str, ValType], ...] = (
+            (self._data,) if parent is None else (self._data, *parent._maps)
+        )
 
     @classmethod
     def from_dict(
@@ -50,6 +60,7 @@ class Scope(Generic[ValType]):
         """Create a new scope based on what is stored in a dict."""
         new_scope = cls(parent)
         new_scope._data = data
+        new_scope._maps = (data, *new_scope._maps[1:])
         return new_scope
 
     def depth(self, name: ScopeSubject) -> int:
@@ -75,13 +86,10 @@ class Scope(Generic[ValType]):
              parent, etc. But if `raise_ = False`, `-1` will be
              returned instead.
         """
-        depth = 0
-        current: Optional[Scope] = self
-        while current is not None:
-            if name.value in current._data:
+        key = name.value
+        for depth, data in enumerate(self._maps):
+            if key in data:
                 return depth
-            current = current._parent
-            depth += 1
         return -1
 
     def down(self) -> "Scope[ValType]":
@@ -91,12 +99,43 @@ class Scope(Generic[ValType]):
     def get(
         self, name: ScopeSubject, default: Optional[ValType] = None
     ) -> Optional[ValType]:
-        if name.value in self._data:
-            return self._data[name.value]
-        if self._parent is not None:
-            return self._parent[name]
+        """
+        Get the value bound to `name` or `default` if it isn't defined
+        anywhere in the hierarchy of scopes.
+        """
+        key = name.value
+        for data in self._maps:
+            if key in data:
+                return data[key]
         return default
 
+    def lookup(self, name: ScopeSubject) -> Tuple[int, ValType]:
+        """
+        Find both how deep a name is in the hierarchy of scopes and its
+        value using a single walk up the hierarchy.
+
+        Parameters
+        ----------
+        name: ScopeSubject
+            The name being searched for.
+
+        Raises
+        ------
+        UndefinedNameError
+            The exception thrown when `name` is not in the scope.
+
+        Returns
+        -------
+        Tuple[int, ValType]
+            The depth of `name` (as returned by `Scope.depth`) and the
+            value that it is bound to.
+        """
+        key = name.value
+        for depth, data in enumerate(self._maps):
+            if key in data:
+                return depth, data[key]
+        raise UndefinedNameError(name)
+
     def up(self) -> "Scope[ValType]":
         """Get the parent of this scope."""
         return self if self._parent is None else self._parent
@@ -108,161 +147,82 @@ class Scope(Generic[ValType]):
             self[wrapped_key] = value
 
     def __bool__(self) -> bool:
-        return bool(self._data) or (self._parent is not None and bool(self._parent))
+        return any(self._maps)
 
     def __contains__(self, name: ScopeSubject) -> bool:
-        return name.value in self._data or (
-            self._parent is not None and name in self._parent
-        )
+        key = name.value
+        for data in self._maps:
+            if key in data:
+                return True
+        return False
 
     def __delitem__(self, name: ScopeSubject) -> None:
-        if name in self:
-            del self._data[name.value]
-        elif self._parent is not None:
-            del self._parent[name]
+        key = name.value
+        for data in self._maps:
+            if key in data:
+                del data[key]
+                return
 
     def __iter__(self) -> Iterator[Tuple[str, ValType]]:
         for key, value in self._data.items():
             yield (key, value)
 
     def __getitem__(self, name: ScopeSubject) -> ValType:
-        if name.value in self._data:
-            return self._data[name.value]
-        if self._parent is not None:
-            return self._parent[name]
+        key = name.value
+        for data in self._maps:
+            if key in data:
+                return data[key]
         raise UndefinedNameError(name)
 
     def __setitem__(self, name: ScopeSubject, value: ValType) -> None:
-        if self._parent is not None and name in self._parent:
-            self._parent[name] = value
-        else:
-            self._data[name.value] = value
-
+        # NOTE: If `name` is already defined above this scope, then it's
+        #  the outermost definition that gets updated.
+        key = name.value
+        for data in reversed(self._maps[1:]):
+            if key in data:
+                data[key] = value
+                return
+        self._data[key] = value
+
+
+_SPAN = (0, 0)
+_BOOL = TypeName(_SPAN, "Bool")
+_X = TVar(_SPAN, "x")
+_X_LIST = TypeApply(_SPAN, TypeName(_SPAN, "List"), _X)
+
+# NOTE: Each row is the operator, its parameter types, its return type
+#  and whether it is generic over `x`.
+_OPERATORS: Sequence[Tuple[str, Sequence[Type], Type, bool]] = (
+    ("and", (_BOOL, _BOOL), _BOOL, False),
+    ("or", (_BOOL, _BOOL), _BOOL, False),
+    ("not", (_BOOL,), _BOOL, False),
+    ("=", (_X, _X), _BOOL, True),
+    ("?=", (_X, _X), _BOOL, True),
+    (">", (_X, _X), _BOOL, True),
+    ("<", (_X, _X), _BOOL, True),
+    (">=", (_X, _X), _BOOL, True),
+    ("<=", (_X, _X), _BOOL, True),
+    ("+", (_X, _X), _X, True),
+    ("-", (_X, _X), _X, True),
+    ("<>", (_X_LIST, _X_LIST), _X_LIST, True),
+    ("*", (_X, _X), _X, True),
+    ("/", (_X, _X), _X, True),
+    ("%", (_X, _X), _X, True),
+    ("~", (_X,), _X, True),
+    ("^", (_X, _X), _X, True),
+)
+
+
+def _build_operator_types() -> Scope[Type]:
+    operator_types: Scope[Type] = Scope(None)
+    for name, param_types, return_type, is_generic in _OPERATORS:
+        type_ = return_type
+        for param_type in reversed(param_types):
+            type_ = TypeApply.func(_SPAN, param_type, type_)
+        operator_types[Name(_SPAN, name)] = (
+            TypeScheme(type_, {_X}) if is_generic else type_
+        )
+    return operator_types
 
-OPERATOR_TYPES: Scope[Type] = Scope(None)
-OPERATOR_TYPES[Name((0, 3), "and")] = TypeApply.func(
-    (5, 25),
-    TypeName((5, 9), "Bool"),
-    TypeApply.func((13, 25), TypeName((13, 17), "Bool"), TypeName((21, 25), "Bool")),
-)
-OPERATOR_TYPES[Name((26, 28), "or")] = TypeApply.func(
-    (30, 50),
-    TypeName((30, 34), "Bool"),
-    TypeApply.func((38, 50), TypeName((38, 42), "Bool"), TypeName((46, 50), "Bool")),
-)
-OPERATOR_TYPES[Name((51, 54), "not")] = TypeApply.func(
-    (56, 68), TypeName((56, 60), "Bool"), TypeName((64, 68), "Bool")
-)
-OPERATOR_TYPES[Name((69, 70), "=")] = TypeScheme(
-    TypeApply.func(
-        (72, 86),
-        TVar((72, 73), "x"),
-        TypeApply.func((77, 86), TVar((77, 78), "x"), TypeName((82, 86), "Bool")),
-    ),
-    {TVar((72, 73), "x")},
-)
-OPERATOR_TYPES[Name((87, 89), "?=")] = TypeScheme(
-    TypeApply.func(
-        (91, 105),
-        TVar((91, 92), "x"),
-        TypeApply.func((96, 105), TVar((96, 97), "x"), TypeName((101, 105), "Bool")),
-    ),
-    {TVar((91, 92), "x")},
-)
-OPERATOR_TYPES[Name((106, 107), ">")] = TypeScheme(
-    TypeApply.func(
-        (109, 123),
-        TVar((109, 110), "x"),
-        TypeApply.func((114, 123), TVar((114, 115), "x"), TypeName((119, 123), "Bool")),
-    ),
-    {TVar((109, 110), "x")},
-)
-OPERATOR_TYPES[Name((124, 125), "<")] = TypeScheme(
-    TypeApply.func(
-        (127, 141),
-        TVar((127, 128), "x"),
-        TypeApply.func((132, 141), TVar((132, 133), "x"), TypeName((137, 141), "Bool")),
-    ),
-    {TVar((127, 128), "x")},
-)
-OPERATOR_TYPES[Name((142, 144), ">=")] = TypeScheme(
-    TypeApply.func(
-        (146, 160),
-        TVar((146, 147), "x"),
-        TypeApply.func((151, 160), TVar((151, 152), "x"), TypeName((156, 160), "Bool")),
-    ),
-    {TVar((146, 147), "x")},
-)
-OPERATOR_TYPES[Name((161, 163), "<=")] = TypeScheme(
-    TypeApply.func(
-        (165, 179),
-        TVar((165, 166), "x"),
-        TypeApply.func((170, 179), TVar((170, 171), "x"), TypeName((175, 179), "Bool")),
-    ),
-    {TVar((165, 166), "x")},
-)
-OPERATOR_TYPES[Name((180, 181), "+")] = TypeScheme(
-    TypeApply.func(
-        (183, 194),
-        TVar((183, 184), "x"),
-        TypeApply.func((188, 194), TVar((188, 189), "x"), TVar((193, 194), "x")),
-    ),
-    {TVar((183, 184), "x")},
-)
-OPERATOR_TYPES[Name((195, 196), "-")] = TypeScheme(
-    TypeApply.func(
-        (198, 209),
-        TVar((198, 199), "x"),
-        TypeApply.func((203, 209), TVar((203, 204), "x"), TVar((208, 209), "x")),
-    ),
-    {TVar((198, 199), "x")},
-)
 
-OPERATOR_TYPES[Name((210, 212), "<>")] = TypeScheme(
-    TypeApply.func(
-        (214, 243),
-        TypeApply((214, 221), TypeName((214, 218), "List"), TVar((219, 220), "x")),
-        TypeApply.func(
-            (225, 243),
-            TypeApply((225, 232), TypeName((225, 229), "List"), TVar((230, 231), "x")),
-            TypeApply((236, 243), TypeName((236, 240), "List"), TVar((241, 242), "x")),
-        ),
-    ),
-    {TVar((219, 220), "x")},
-)
-OPERATOR_TYPES[Name((244, 245), "*")] = TypeScheme(
-    TypeApply.func(
-        (247, 258),
-        TVar((247, 248), "x"),
-        TypeApply.func((252, 258), TVar((252, 253), "x"), TVar((257, 258), "x")),
-    ),
-    {TVar((247, 248), "x")},
-)
-OPERATOR_TYPES[Name((259, 260), "/")] = TypeScheme(
-    TypeApply.func(
-        (262, 273),
-        TVar((262, 263), "x"),
-        TypeApply.func((267, 273), TVar((267, 268), "x"), TVar((272, 273), "x")),
-    ),
-    {TVar((262, 263), "x")},
-)
-OPERATOR_TYPES[Name((274, 275), "%")] = TypeScheme(
-    TypeApply.func(
-        (277, 288),
-        TVar((277, 278), "x"),
-        TypeApply.func((282, 288), TVar((282, 283), "x"), TVar((287, 288), "x")),
-    ),
-    {TVar((277, 278), "x")},
-)
-OPERATOR_TYPES[Name((289, 290), "~")] = TypeScheme(
-    TypeApply.func((292, 303), TVar((297, 298), "x"), TVar((302, 303), "x")),
-    {TVar((292, 293), "x")},
-)
-OPERATOR_TYPES[Name((304, 305), "^")] = TypeScheme(
-    TypeApply.func(
-        (307, 323),
-        TVar((312, 313), "x"),
-        TypeApply.func((317, 323), TVar((317, 318), "x"), TVar((322, 323), "x")),
-    ),
-    {TVar((307, 308), "x")},
-)
+OPERATOR_TYPES: Scope[Type] = _build_operator_types()
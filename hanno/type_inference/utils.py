@@ -235,15 +235,10 @@ def pattern_infer(pattern: base.Pattern, scope: Scope[Type]) -> Tuple[StrScope,
         The names introduced by `pattern` and the inferred type of the
         values matching against `pattern`.
     """
-    if isinstance(pattern, base.UnitPattern):
-        return {}, TypeName.unit(pattern.span)
-    if isinstance(pattern, base.PinnedName):
-        return {pattern.value: scope[pattern]}, scope[pattern]
+    # NOTE: Names and pairs are checked first since they are the most common patterns.
     if isinstance(pattern, base.FreeName):
         type_ = TypeVar.unknown(pattern.span)
         return ({} if pattern.value == "_" else {pattern.value: type_}), type_
-    if isinstance(pattern, base.ScalarPattern):
-        return {}, TypeName(pattern.span, SCALAR_TYPE_NAMES[type(pattern.value)])
     if isinstance(pattern, base.PairPattern):
         first_scope, first_type = pattern_infer(pattern.first, scope)
         second_scope, second_type = pattern_infer(pattern.second, scope)
@@ -251,6 +246,12 @@ def pattern_infer(pattern: base.Pattern, scope: Scope[Type]) -> Tuple[StrScope,
             {**first_scope, **second_scope},
             TypeApply.pair(pattern.span, first_type, second_type),
         )
+    if isinstance(pattern, base.UnitPattern):
+        return {}, TypeName.unit(pattern.span)
+    if isinstance(pattern, base.PinnedName):
+        return {pattern.value: scope[pattern]}, scope[pattern]
+    if isinstance(pattern, base.ScalarPattern):
+        return {}, TypeName(pattern.span, SCALAR_TYPE_NAMES[type(pattern.value)])
     if isinstance(pattern, base.ListPattern):
         return _list_pattern_infer(pattern, scope)
     assert False
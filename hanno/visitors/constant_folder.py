@@ -1,5 +1,5 @@
-from operator import add, floordiv, mod, mul, sub, truediv
-from typing import Container, Tuple, Union
+from operator import add, floordiv, is_, mod, mul, sub, truediv
+from typing import Callable, Container, Mapping, Sequence, Tuple, Union
 
 from asts.base import ValidScalarTypes
 from asts.visitor import LoweredASTVisitor
@@ -19,6 +19,13 @@ MATH_OPS: Container[lowered.OperationTypes] = (
     lowered.OperationTypes.EXP,
     lowered.OperationTypes.MOD,
 )
+MATH_FUNCS: Mapping[lowered.OperationTypes, Callable[..., ValidScalarTypes]] = {
+    lowered.OperationTypes.ADD: add,
+    lowered.OperationTypes.SUB: sub,
+    lowered.OperationTypes.MUL: mul,
+    lowered.OperationTypes.EXP: pow,
+    lowered.OperationTypes.MOD: mod,
+}
 
 
 def fold_constants(tree: lowered.LoweredASTNode) -> lowered.LoweredASTNode:
@@ -42,7 +49,9 @@ def fold_constants(tree: lowered.LoweredASTNode) -> lowered.LoweredASTNode:
 
 class ConstantFolder(LoweredASTVisitor[lowered.LoweredASTNode]):
     """
-    Combine literal operations into a single AST node.
+    Combine literal operations into a single AST node. Subtrees that
+    have nothing to fold are returned as they are instead of being
+    rebuilt.
 
     Attributes
     ----------
@@ -53,65 +62,98 @@ class ConstantFolder(LoweredASTVisitor[lowered.LoweredASTNode]):
     def __init__(self) -> None:
         self.current_scope: Scope[lowered.Scalar] = Scope(None)
 
-    def visit_apply(self, node: lowered.Apply) -> lowered.Apply:
-        return lowered.Apply(node.func.visit(self), node.arg.visit(self))
+    def visit_apply(self, node: lowered.Apply) -> lowered.LoweredASTNode:
+        arg = self.visit(node.arg)
+        if (
+            isinstance(node.func, lowered.Function)
+            and isinstance(arg, lowered.Scalar)
+            and _can_beta_reduce(node.func, self.current_scope)
+        ):
+            self.current_scope = self.current_scope.down()
+            self.current_scope[node.func.param] = arg
+            body = self.visit(node.func.body)
+            self.current_scope = self.current_scope.up()
+            return body
+
+        func = self.visit(node.func)
+        if func is node.func and arg is node.arg:
+            return node
+        return lowered.Apply(func, arg)
 
     def visit_block(self, node: lowered.Block) -> lowered.ASTNode:
         self.current_scope = self.current_scope.down()
         body = tuple(
             filter(
                 lambda expr: not expr.metadata.get("delete", False),
-                map(lambda expr: expr.visit(self), node.body),
+                map(self.visit, node.body),
             )
         )
         self.current_scope = self.current_scope.up()
-        return (
-            lowered.Unit()
-            if not body
-            else body[0] if len(body) == 1 else lowered.Block(body)
-        )
+        if not body:
+            return lowered.Unit()
+        if len(body) == 1:
+            return body[0]
+        if _all_same(body, node.body):
+            return node
+        return lowered.Block(body)
 
-    def visit_cond(self, node: lowered.Cond) -> lowered.Cond:
-        pred = node.pred.visit(self)
+    def visit_cond(self, node: lowered.Cond) -> lowered.LoweredASTNode:
+        pred = self.visit(node.pred)
         if isinstance(pred, lowered.Scalar):
-            return node.cons.visit(self) if pred.value else node.else_.visit(self)
-        return lowered.Cond(pred, node.cons.visit(self), node.else_.visit(self))
+            return self.visit(node.cons) if pred.value else self.visit(node.else_)
+
+        cons, else_ = self.visit(node.cons), self.visit(node.else_)
+        if pred is node.pred and cons is node.cons and else_ is node.else_:
+            return node
+        return lowered.Cond(pred, cons, else_)
 
     def visit_define(self, node: lowered.Define) -> lowered.LoweredASTNode:
-        value = node.value.visit(self)
+        value = self.visit(node.value)
         if isinstance(value, lowered.Scalar):
             self.current_scope[node.target] = value
             node.metadata["delete"] = True
             return node
-        return lowered.Define(node.target, value)
+        return node if value is node.value else lowered.Define(node.target, value)
 
     def visit_function(self, node: lowered.Function) -> lowered.Function:
         self.current_scope = self.current_scope.down()
-        body = node.body.visit(self)
+        body = self.visit(node.body)
         self.current_scope = self.current_scope.up()
-        return lowered.Function(node.param, body)
+        return node if body is node.body else lowered.Function(node.param, body)
 
     def visit_list(self, node: lowered.List) -> lowered.List:
-        return lowered.List([elem.visit(self) for elem in node.elements])
+        elements = [self.visit(elem) for elem in node.elements]
+        return node if _all_same(elements, node.elements) else lowered.List(elements)
 
     def visit_pair(self, node: lowered.Pair) -> lowered.Pair:
-        return lowered.Pair(node.first.visit(self), node.second.visit(self))
+        first, second = self.visit(node.first), self.visit(node.second)
+        if first is node.first and second is node.second:
+            return node
+        return lowered.Pair(first, second)
 
     def visit_name(self, node: lowered.Name) -> Union[lowered.Name, lowered.Scalar]:
         return self.current_scope[node] if node in self.current_scope else node
 
     def visit_native_op(self, node: lowered.NativeOp) -> lowered.LoweredASTNode:
-        left = node.left.visit(self)
-        right = None if node.right is None else node.right.visit(self)
-        node = lowered.NativeOp(node.operation, left, right)
-        if _can_simplify_negate(node):
-            return lowered.Scalar(-left.value)
-        if _can_simplify_math_op(node):
-            return lowered.Scalar(fold_math(node.operation, left, right))
-        if _can_simplify_compare_op(node):
-            success, result = fold_comparison(node.operation, left, right)
-            return lowered.Scalar(result) if success else node
-        return node
+        operation = node.operation
+        left = self.visit(node.left)
+        right = None if node.right is None else self.visit(node.right)
+        if isinstance(left, lowered.Scalar):
+            if operation == lowered.OperationTypes.NEG and isinstance(
+                left.value, (int, float)
+            ):
+                return lowered.Scalar(-left.value)
+            if isinstance(right, lowered.Scalar):
+                if operation in MATH_OPS:
+                    return lowered.Scalar(fold_math(operation, left, right))
+                if operation in COMPARE_OPS:
+                    success, result = fold_comparison(operation, left, right)
+                    if success:
+                        return lowered.Scalar(result)
+
+        if left is node.left and right is node.right:
+            return node
+        return lowered.NativeOp(operation, left, right)
 
     def visit_scalar(self, node: lowered.Scalar) -> lowered.Scalar:
         return node
@@ -120,20 +162,60 @@ class ConstantFolder(LoweredASTVisitor[lowered.LoweredASTNode]):
         return node
 
 
-_can_simplify_compare_op = lambda node: (
-    node.operation in COMPARE_OPS
-    and isinstance(node.left, lowered.Scalar)
-    and isinstance(node.right, lowered.Scalar)
-)
-_can_simplify_math_op = lambda node: (
-    node.operation in MATH_OPS
-    and isinstance(node.left, lowered.Scalar)
-    and isinstance(node.right, lowered.Scalar)
-)
-_can_simplify_negate = lambda node: (
-    node.operation == lowered.OperationTypes.NEG
-    and isinstance(node.left, lowered.Scalar)
-)
+def _all_same(
+    new_nodes: Sequence[lowered.LoweredASTNode],
+    old_nodes: Sequence[lowered.LoweredASTNode],
+) -> bool:
+    return len(new_nodes) == len(old_nodes) and all(map(is_, new_nodes, old_nodes))
+
+
+def _can_beta_reduce(func: lowered.Function, scope: Scope[lowered.Scalar]) -> bool:
+    return func.param not in scope and not _Rebinder(func.param).run(func.body)
+
+
+class _Rebinder(LoweredASTVisitor[bool]):
+    """
+    Check whether a name is bound again somewhere inside a subtree,
+    either as a function parameter or as the target of a definition.
+    """
+
+    def __init__(self, name: lowered.Name) -> None:
+        self.name: lowered.Name = name
+
+    def visit_apply(self, node: lowered.Apply) -> bool:
+        return self.visit(node.func) or self.visit(node.arg)
+
+    def visit_block(self, node: lowered.Block) -> bool:
+        return any(self.visit(expr) for expr in node.body)
+
+    def visit_cond(self, node: lowered.Cond) -> bool:
+        return self.visit(node.pred) or self.visit(node.cons) or self.visit(node.else_)
+
+    def visit_define(self, node: lowered.Define) -> bool:
+        return node.target == self.name or self.visit(node.value)
+
+    def visit_function(self, node: lowered.Function) -> bool:
+        return node.param == self.name or self.visit(node.body)
+
+    def visit_list(self, node: lowered.List) -> bool:
+        return any(self.visit(elem) for elem in node.elements)
+
+    def visit_pair(self, node: lowered.Pair) -> bool:
+        return self.visit(node.first) or self.visit(node.second)
+
+    def visit_name(self, node: lowered.Name) -> bool:
+        return False
+
+    def visit_native_op(self, node: lowered.NativeOp) -> bool:
+        return self.visit(node.left) or (
+            node.right is not None and self.visit(node.right)
+        )
+
+    def visit_scalar(self, node: lowered.Scalar) -> bool:
+        return False
+
+    def visit_unit(self, node: lowered.Unit) -> bool:
+        return False
 
 
 def fold_math(
@@ -161,13 +243,7 @@ def fold_math(
     if operation == lowered.OperationTypes.DIV:
         func = floordiv if isinstance(left.value, int) else truediv
     else:
-        func = {
-            lowered.OperationTypes.ADD: add,
-            lowered.OperationTypes.SUB: sub,
-            lowered.OperationTypes.MUL: mul,
-            lowered.OperationTypes.EXP: pow,
-            lowered.OperationTypes.MOD: mod,
-        }[operation]
+        func = MATH_FUNCS[operation]
     return func(left.value, right.value)
 
 
@@ -1,6 +1,5 @@
 # TODO: Ensure that functions marked for inlining aren't recursive to
 #  prevent infinite loops.
-from functools import lru_cache
 from typing import Callable, Collection, List, Sequence, Set
 
 from asts import lowered, visitor
@@ -44,28 +43,28 @@ class Scorer(visitor.LoweredASTVisitor[int]):
     """
 
     def visit_apply(self, node: lowered.Apply) -> int:
-        return 2 + node.func.visit(self) + node.arg.visit(self)
+        return 2 + self.visit(node.func) + self.visit(node.arg)
 
     def visit_block(self, node: lowered.Block) -> int:
-        return 5 + sum(expr.visit(self) for expr in node.body)
+        return 5 + sum(self.visit(expr) for expr in node.body)
 
     def visit_cond(self, node: lowered.Cond) -> int:
         return (
-            6 + node.pred.visit(self) + node.cons.visit(self) + node.else_.visit(self)
+            6 + self.visit(node.pred) + self.visit(node.cons) + self.visit(node.else_)
         )
 
     def visit_define(self, node: lowered.Define) -> int:
-        return 4 + node.value.visit(self)
+        return 4 + self.visit(node.value)
 
     def visit_function(self, node: lowered.Function) -> int:
-        return 7 + node.body.visit(self)
+        return 7 + self.visit(node.body)
 
     def visit_list(self, node: lowered.List) -> int:
-        element_score = sum(elem.visit(self) for elem in node.elements)
+        element_score = sum(self.visit(elem) for elem in node.elements)
         return (3 + element_score) if element_score else 1
 
     def visit_pair(self, node: lowered.Pair) -> int:
-        return 2 + node.first.visit(self) + node.second.visit(self)
+        return 2 + self.visit(node.first) + self.visit(node.second)
 
     def visit_name(self, node: lowered.Name) -> int:
         return 0
@@ -73,8 +72,8 @@ class Scorer(visitor.LoweredASTVisitor[int]):
     def visit_native_op(self, node: lowered.NativeOp) -> int:
         return (
             1
-            + node.left.visit(self)
-            + (0 if node.right is None else node.right.visit(self))
+            + self.visit(node.left)
+            + (0 if node.right is None else self.visit(node.right))
         )
 
     def visit_scalar(self, node: lowered.Scalar) -> int:
@@ -95,42 +94,42 @@ class Finder(visitor.LoweredASTVisitor[None]):
         self.defined_funcs: Set[lowered.Function] = set()
 
     def visit_apply(self, node: lowered.Apply) -> None:
-        node.func.visit(self)
-        node.arg.visit(self)
+        self.visit(node.func)
+        self.visit(node.arg)
 
     def visit_block(self, node: lowered.Block) -> None:
         for expr in node.body:
-            expr.visit(self)
+            self.visit(expr)
 
     def visit_cond(self, node: lowered.Cond) -> None:
-        node.pred.visit(self)
-        node.cons.visit(self)
-        node.else_.visit(self)
+        self.visit(node.pred)
+        self.visit(node.cons)
+        self.visit(node.else_)
 
     def visit_define(self, node: lowered.Define) -> None:
-        node.value.visit(self)
+        self.visit(node.value)
         if isinstance(node.value, lowered.Function):
             self.defined_funcs.add(node.value)
 
     def visit_function(self, node: lowered.Function) -> None:
-        node.body.visit(self)
+        self.visit(node.body)
         self.funcs.append(node)
 
     def visit_list(self, node: lowered.List) -> None:
         for elem in node.elements:
-            elem.visit(self)
+            self.visit(elem)
 
     def visit_pair(self, node: lowered.Pair) -> None:
-        node.first.visit(self)
-        node.second.visit(self)
+        self.visit(node.first)
+        self.visit(node.second)
 
     def visit_name(self, node: lowered.Name) -> None:
         return
 
     def visit_native_op(self, node: lowered.NativeOp) -> None:
-        node.left.visit(self)
+        self.visit(node.left)
         if node.right is not None:
-            node.right.visit(self)
+            self.visit(node.right)
 
     def visit_scalar(self, node: lowered.Scalar) -> None:
         return
@@ -149,51 +148,47 @@ class Inliner(visitor.LoweredASTVisitor[lowered.LoweredASTNode]):
         self.current_scope: Scope[lowered.Function] = Scope(None)
         self.targets: Collection[lowered.Function] = targets
 
-    @lru_cache
-    def is_target(self, node: lowered.LoweredASTNode) -> bool:
+    def is_target(self, node: lowered.Function) -> bool:
         """Check if a function is supposed to be inlined."""
-        return isinstance(node, lowered.Function) and any(
-            node == target for target in self.targets
-        )
+        return any(node == target for target in self.targets)
 
-    @lru_cache
     def name_is_target(self, name: lowered.Name) -> bool:
         """Check if a name is suitable for inlining."""
         result = self.current_scope.get(name)
         return result is not None and self.is_target(result)
 
     def visit_apply(self, node: lowered.Apply) -> lowered.LoweredASTNode:
-        func, arg = node.func.visit(self), node.arg.visit(self)
-        if self.is_target(func):
+        func, arg = self.visit(node.func), self.visit(node.arg)
+        if isinstance(func, lowered.Function) and self.is_target(func):
             return inline_function(func, arg)
         if isinstance(func, lowered.Name) and self.name_is_target(func):
             return inline_function(self.current_scope[func], arg)
         return lowered.Apply(func, arg)
 
     def visit_block(self, node: lowered.Block) -> lowered.Block:
-        return lowered.Block([expr.visit(self) for expr in node.body])
+        return lowered.Block([self.visit(expr) for expr in node.body])
 
     def visit_cond(self, node: lowered.Cond) -> lowered.Cond:
         return lowered.Cond(
-            node.pred.visit(self),
-            node.cons.visit(self),
-            node.else_.visit(self),
+            self.visit(node.pred),
+            self.visit(node.cons),
+            self.visit(node.else_),
         )
 
     def visit_define(self, node: lowered.Define) -> lowered.Define:
-        value = node.value.visit(self)
-        if self.is_target(value):
+        value = self.visit(node.value)
+        if isinstance(value, lowered.Function) and self.is_target(value):
             self.current_scope[node.target] = value
         return lowered.Define(node.target, value)
 
     def visit_function(self, node: lowered.Function) -> lowered.Function:
-        return lowered.Function(node.param, node.body.visit(self))
+        return lowered.Function(node.param, self.visit(node.body))
 
     def visit_list(self, node: lowered.List) -> lowered.List:
-        return lowered.List([elem.visit(self) for elem in node.elements])
+        return lowered.List([self.visit(elem) for elem in node.elements])
 
     def visit_pair(self, node: lowered.Pair) -> lowered.Pair:
-        return lowered.Pair(node.first.visit(self), node.second.visit(self))
+        return lowered.Pair(self.visit(node.first), self.visit(node.second))
 
     def visit_name(self, node: lowered.Name) -> lowered.Name:
         return node
@@ -201,8 +196,8 @@ class Inliner(visitor.LoweredASTVisitor[lowered.LoweredASTNode]):
     def visit_native_op(self, node: lowered.NativeOp) -> lowered.NativeOp:
         return lowered.NativeOp(
             node.operation,
-            node.left.visit(self),
-            None if node.right is None else node.right.visit(self),
+            self.visit(node.left),
+            None if node.right is None else self.visit(node.right),
         )
 
     def visit_scalar(self, node: lowered.Scalar) -> lowered.Scalar:
@@ -219,35 +214,35 @@ class _Replacer(visitor.LoweredASTVisitor[lowered.LoweredASTNode]):
 
     def visit_apply(self, node: lowered.Apply) -> lowered.LoweredASTNode:
         return lowered.Apply(
-            node.func.visit(self),
-            node.arg.visit(self),
+            self.visit(node.func),
+            self.visit(node.arg),
         )
 
     def visit_block(self, node: lowered.Block) -> lowered.Block:
-        return lowered.Block([expr.visit(self) for expr in node.body])
+        return lowered.Block([self.visit(expr) for expr in node.body])
 
     def visit_cond(self, node: lowered.Cond) -> lowered.Cond:
         return lowered.Cond(
-            node.pred.visit(self),
-            node.cons.visit(self),
-            node.else_.visit(self),
+            self.visit(node.pred),
+            self.visit(node.cons),
+            self.visit(node.else_),
         )
 
     def visit_define(self, node: lowered.Define) -> lowered.Define:
-        return lowered.Define(node.target, node.value.visit(self))
+        return lowered.Define(node.target, self.visit(node.value))
 
     def visit_function(self, node: lowered.Function) -> lowered.Function:
         return (
             node
             if node.param == self.inlined_param
-            else lowered.Function(node.param, node.body.visit(self))
+            else lowered.Function(node.param, self.visit(node.body))
         )
 
     def visit_list(self, node: lowered.List) -> lowered.List:
-        return lowered.List([elem.visit(self) for elem in node.elements])
+        return lowered.List([self.visit(elem) for elem in node.elements])
 
     def visit_pair(self, node: lowered.Pair) -> lowered.Pair:
-        return lowered.Pair(node.first.visit(self), node.second.visit(self))
+        return lowered.Pair(self.visit(node.first), self.visit(node.second))
 
     def visit_name(self, node: lowered.Name) -> lowered.LoweredASTNode:
         return self.new_value if node == self.inlined_param else node
@@ -255,8 +250,8 @@ class _Replacer(visitor.LoweredASTVisitor[lowered.LoweredASTNode]):
     def visit_native_op(self, node: lowered.NativeOp) -> lowered.NativeOp:
         return lowered.NativeOp(
             node.operation,
-            node.left.visit(self),
-            None if node.right is None else node.right.visit(self),
+            self.visit(node.left),
+            None if node.right is None else self.visit(node.right),
         )
 
     def visit_scalar(self, node: lowered.Scalar) -> lowered.Scalar:
@@ -25,6 +25,6 @@ from visitors import (
     string_expander,
 )
 
-base.ASTNode.__repr__ = lambda node: node.visit(pprint.ASTPrinter())
-typed.TypedASTNode.__repr__ = lambda node: node.visit(pprint.TypedASTPrinter())
-lowered.LoweredASTNode.__repr__ = lambda node: node.visit(pprint.LoweredASTPrinter())
+base.ASTNode.__repr__ = lambda node: pprint.ASTPrinter().show(node)
+typed.TypedASTNode.__repr__ = lambda node: pprint.TypedASTPrinter().show(node)
+lowered.LoweredASTNode.__repr__ = lambda node: pprint.LoweredASTPrinter().show(node)
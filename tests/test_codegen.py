@@ -153,7 +153,7 @@ _prepare = lambda source: parse.parse(lex.infer_eols(lex.lex(source)))
 )
 def test_instruction_generator(node, expected):
     generator = codegen.InstructionGenerator()
-    actual = tuple(generator.run(node))
+    actual = tuple(generator.generate(node))
     assert expected == actual
 
 
@@ -341,6 +341,18 @@ def test_encode_operands(
     assert expected_code == actual_code
 
 
+@mark.codegen
+def test_encode_instructions_reuses_strings():
+    load_hi = codegen.Instruction(codegen.OpCodes.LOAD_STRING, ("hi",))
+    load_func = codegen.Instruction(codegen.OpCodes.LOAD_FUNC, ((load_hi,),))
+    load_bye = codegen.Instruction(codegen.OpCodes.LOAD_STRING, ("bye",))
+    stream, _, string_pool = codegen.encode_instructions(
+        (load_hi, load_func, load_bye, load_hi), [], []
+    )
+    assert [b"hi", b"bye"] == string_pool
+    assert stream[-7:] == stream[1:8] == b"\x00\x00\x00\x00\x00\x00\x00"
+
+
 @mark.codegen
 @mark.parametrize(
     "source,expected",
@@ -348,6 +360,7 @@ def test_encode_operands(
         (b"", b""),
         (b"\x00", b"\x00"),
         (b"aaaabbcccccdeeeeeeeeee", b"\x04a\x02b\x05c\x01d\x0ae"),
+        ((b"x" * 265) + (b"y" * 510), b"\xffx\x0ax\xffy\xffy"),
     ),
 )
 def test_compress(source, expected):
@@ -139,6 +139,24 @@ from context import constant_folder, lowered
             ),
             lowered.List([lowered.Pair(lowered.Scalar(1), lowered.Scalar(-24))]),
         ),
+        (
+            lowered.Apply(
+                lowered.Function(
+                    lowered.Name("n"),
+                    lowered.Cond(
+                        lowered.NativeOp(
+                            lowered.OperationTypes.GREATER,
+                            lowered.Name("n"),
+                            lowered.Scalar(0),
+                        ),
+                        lowered.Name("n"),
+                        lowered.NativeOp(lowered.OperationTypes.NEG, lowered.Name("n")),
+                    ),
+                ),
+                lowered.Scalar(-5),
+            ),
+            lowered.Scalar(5),
+        ),
     ),
 )
 def test_fold_constants(tree, expected):
@@ -146,6 +164,57 @@ def test_fold_constants(tree, expected):
     assert expected == actual
 
 
+@mark.constant_folding
+@mark.optimisation
+@mark.parametrize(
+    "tree",
+    (
+        lowered.Apply(
+            lowered.Function(
+                lowered.Name("n"),
+                lowered.Function(lowered.Name("n"), lowered.Name("n")),
+            ),
+            lowered.Scalar(5),
+        ),
+        lowered.Apply(
+            lowered.Function(
+                lowered.Name("n"),
+                lowered.Block(
+                    [
+                        lowered.Define(lowered.Name("n"), lowered.Name("m")),
+                        lowered.Name("n"),
+                    ]
+                ),
+            ),
+            lowered.Scalar(5),
+        ),
+    ),
+)
+def test_fold_constants_with_rebound_params(tree):
+    actual = constant_folder.fold_constants(tree)
+    assert tree == actual
+
+
+@mark.constant_folding
+@mark.optimisation
+def test_fold_constants_keeps_unchanged_subtrees():
+    unchanged = lowered.Function(
+        lowered.Name("x"),
+        lowered.NativeOp(
+            lowered.OperationTypes.ADD, lowered.Name("x"), lowered.Scalar(1)
+        ),
+    )
+    tree = lowered.Pair(
+        unchanged,
+        lowered.NativeOp(
+            lowered.OperationTypes.MUL, lowered.Scalar(2), lowered.Scalar(3)
+        ),
+    )
+    actual = constant_folder.fold_constants(tree)
+    assert actual.first is unchanged
+    assert lowered.Scalar(6) == actual.second
+
+
 @mark.constant_folding
 @mark.optimisation
 @mark.parametrize(
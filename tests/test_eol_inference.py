@@ -1,6 +1,6 @@
-from pytest import mark
+from pytest import mark, raises
 
-from context import lex
+from context import errors, lex
 
 
 @mark.eol_inference
@@ -98,3 +98,26 @@ def test_can_add_eol_for_true_cases(prev, current, next_):
 )
 def test_can_add_eol_for_false_cases(prev, current, next_, paren_stack_size):
     assert not lex.can_add_eol(prev, current, next_, paren_stack_size)
+
+
+@mark.eol_inference
+@mark.parametrize(
+    "source",
+    (
+        "",
+        "1.01",
+        "let x = 1\nlet y = [\n  x,\n  2\n]\n",
+        "f(a,\n  b)  # comment\n# another comment\n\ng x\n",
+        "if a\nthen b\nelse c",
+    ),
+)
+def test_lex_with_eols(source):
+    expected = tuple(lex.infer_eols(lex.lex(source)))
+    actual = tuple(lex.lex_with_eols(source))
+    assert expected == actual
+
+
+@mark.eol_inference
+def test_lex_with_eols_for_illegal_chars():
+    with raises(errors.IllegalCharError):
+        lex.lex_with_eols("let x = 1 @ 2\n")
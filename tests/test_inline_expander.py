@@ -106,6 +106,30 @@ def test_inline_function():
     assert expected == actual
 
 
+@mark.inline_expansion
+@mark.optimisation
+def test_expand_inline_after_earlier_lookup():
+    tree = lowered.Block(
+        [
+            lowered.Apply(lowered.Name("id"), lowered.Scalar(0)),
+            lowered.Define(lowered.Name("id"), identity_func),
+            lowered.Apply(lowered.Name("id"), lowered.Scalar(1)),
+        ]
+    )
+    actual = inline_expander.expand_inline(tree, 1)
+    assert lowered.Scalar(1) == actual.body[-1]
+
+
+@mark.inline_expansion
+@mark.optimisation
+def test_visit_node_subclass():
+    class SubName(lowered.Name):
+        __slots__ = ()
+
+    assert NameFinder("x").run(SubName("x"))
+    assert not NameFinder("y").run(SubName("x"))
+
+
 @mark.inline_expansion
 @mark.optimisation
 @mark.parametrize(
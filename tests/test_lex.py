@@ -20,6 +20,18 @@ def test_to_utf8(source, expected):
     assert expected == lex.to_utf8(source)
 
 
+@mark.lexing
+@mark.parametrize(
+    "source,encoding,expected",
+    (
+        (b"Fran\xe7ais", "latin-1", "Français"),
+        (b"\xf9\xf1\xdf", "cp1253", "ωρί"),
+    ),
+)
+def test_to_utf8_with_encoding(source, encoding, expected):
+    assert expected == lex.to_utf8(source, encoding)
+
+
 @mark.lexing
 @mark.parametrize(
     "source",
@@ -68,6 +80,30 @@ def test_to_utf8_raises_bad_encoding_error(source):
                 lex.Token((68, 69), lex.TokenTypes.rparen, None),
             ),
         ),
+        (
+            r'"say \"hi\"" x',
+            (
+                lex.Token((0, 12), lex.TokenTypes.string, r'"say \"hi\""'),
+                lex.Token((13, 14), lex.TokenTypes.name, "x"),
+            ),
+        ),
+        (
+            r'"C:\\" y',
+            (
+                lex.Token((0, 6), lex.TokenTypes.string, r'"C:\\"'),
+                lex.Token((7, 8), lex.TokenTypes.name, "y"),
+            ),
+        ),
+        (
+            "True or Trueish and False_",
+            (
+                lex.Token((0, 4), lex.TokenTypes.true, None),
+                lex.Token((5, 7), lex.TokenTypes.or_, None),
+                lex.Token((8, 15), lex.TokenTypes.type_name, "Trueish"),
+                lex.Token((16, 19), lex.TokenTypes.and_, None),
+                lex.Token((20, 26), lex.TokenTypes.type_name, "False_"),
+            ),
+        ),
     ),
 )
 def test_lex(source, expected):
@@ -76,6 +112,24 @@ def test_lex(source, expected):
         assert expected_token == actual_token
 
 
+@mark.lexing
+def test_tokens_compare_and_hash_by_value():
+    first = lex.Token((0, 3), lex.TokenTypes.name, "foo")
+    second = lex.Token((0, 3), lex.TokenTypes.name, "foo")
+    other = lex.Token((4, 7), lex.TokenTypes.name, "foo")
+    assert first == second
+    assert first != other
+    assert hash(first) == hash(second)
+    assert len({first, second, other}) == 2
+
+
+@mark.lexing
+@mark.parametrize("source", ('"unclosed', r'"escaped end\"'))
+def test_lex_for_unclosed_strings(source):
+    with raises(errors.IllegalCharError):
+        lex.lex(source)
+
+
 @mark.lexing
 @mark.parametrize(
     "source,accepted_newlines",
@@ -118,6 +172,11 @@ def test_normalise_newlines_for_failures(source, accepted_newlines):
             "is_running and\niterations > 100",
             ("\r", "\n", "\r\n"),
         ),
+        (
+            "let x = 1\nx + 2\n",
+            "let x = 1\nx + 2\n",
+            ("\n",),
+        ),
     ),
 )
 def test_normalise_newlines(source, expected, accepted_newlines):
@@ -316,3 +375,31 @@ def test_token_stream_consume_if(tokens, expected_types, expected):
 def test_token_stream_peek(tokens, expected_types, expected):
     inst = lex.TokenStream(tokens, ())
     assert inst.peek(*expected_types) is expected
+
+
+@mark.lexing
+@mark.parametrize(
+    "tokens,ignore,expected",
+    (
+        ((), (), None),
+        (
+            (lex.Token((0, 4), lex.TokenTypes.comment, "# hi"),),
+            (lex.TokenTypes.comment,),
+            None,
+        ),
+        (
+            (
+                lex.Token((0, 1), lex.TokenTypes.whitespace, " "),
+                lex.Token((1, 2), lex.TokenTypes.lparen, None),
+            ),
+            (lex.TokenTypes.whitespace,),
+            lex.TokenTypes.lparen,
+        ),
+    ),
+)
+def test_token_stream_current_type(tokens, ignore, expected):
+    inst = lex.TokenStream(tokens, ignore)
+    assert inst.current_type is expected
+    if expected is not None:
+        assert inst.next().type_ is expected
+        assert inst.current_type is None
@@ -1,4 +1,4 @@
-from pytest import mark
+from pytest import mark, raises
 
 from context import base, errors, lex, parse, types
 
@@ -165,6 +165,14 @@ _prepare = lambda source: lex.infer_eols(lex.lex(source))
                 ),
             ),
         ),
+        (
+            "curried(1)(2)",
+            base.Apply(
+                span,
+                base.Apply(span, base.Name(span, "curried"), base.Scalar(span, 1)),
+                base.Scalar(span, 2),
+            ),
+        ),
         (
             "plus_1 :: Int -> Int",
             base.Annotation(
@@ -195,3 +203,34 @@ def test_parse_annotation():
     )
     with raises(errors.UnexpectedTokenError):
         parse.parse_annotation(stream, base.Scalar(span, 66))
+
+
+@mark.integration
+@mark.parsing
+@mark.parametrize("source", ("f [if", "f (x, if", "f [let ^ end"))
+def test_parser_for_unfinished_arguments(source):
+    with raises(errors.UnexpectedTokenError):
+        parse.parse(_prepare(source))
+
+
+@mark.integration
+@mark.parsing
+def test_parser_for_long_pairs():
+    names = [f"x_{index}" for index in range(2000)]
+    actual = parse.parse(_prepare(", ".join(names)))
+    for name in names[:-1]:
+        assert name == actual.first.value
+        actual = actual.second
+    assert names[-1] == actual.value
+
+
+@mark.integration
+@mark.parsing
+def test_parser_for_long_operator_chains():
+    names = [f"x_{index}" for index in range(2000)]
+    actual = parse.parse(_prepare(" / ".join(names)))
+    for name in names[:-1]:
+        assert "/" == actual.func.func.value
+        assert name == actual.func.arg.value
+        actual = actual.arg
+    assert names[-1] == actual.value
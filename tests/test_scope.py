@@ -1,4 +1,6 @@
-from context import base, scope
+from pytest import raises
+
+from context import base, errors, scope
 
 
 def test_scope_down():
@@ -61,3 +63,33 @@ def test_scope_depth_with_shadowing():
     child[lower_name] = base.Scalar((10, 12), 67)
     assert child.depth(upper_name) == 4
     assert child.depth(lower_name) == 4
+
+
+def test_scope_lookup_with_nesting():
+    parent = scope.Scope(None)
+    name = base.Name((0, 6), "my_var")
+    value = base.Scalar((10, 12), 42)
+    parent[name] = value
+    child = parent.down().down()
+    assert child.lookup(name) == (2, value)
+
+
+def test_scope_lookup_with_undefined_name():
+    with raises(errors.UndefinedNameError):
+        scope.Scope(None).lookup(base.Name((0, 1), "<+>"))
+
+
+def test_scope_get_with_undefined_name_in_child():
+    child = scope.Scope(None).down().down()
+    default = base.Scalar((0, 1), 0)
+    assert child.get(base.Name((0, 1), "<+>"), default) is default
+
+
+def test_scope_delete_from_parent():
+    parent = scope.Scope(None)
+    name = base.Name((0, 6), "my_var")
+    parent[name] = base.Scalar((10, 12), 42)
+    child = parent.down()
+    del child[name]
+    assert name not in child
+    assert name not in parent
@@ -1,6 +1,6 @@
 from pytest import mark, raises
 
-from context import errors, lex, parse, types, type_inference
+from context import errors, lex, parse, pprint, types, type_inference
 
 _prepare = lambda source: parse.parse(lex.infer_eols(lex.lex(source)))
 
@@ -345,3 +345,16 @@ def test_find_free_vars(type_, expected):
     result = type_inference.find_free_vars(type_)
     actual = {var.value for var in result}
     assert expected == actual
+
+
+@mark.type_inference
+@mark.parametrize("names", ("ABCD", "ABCDE"))
+def test_tuple_keeps_element_order(names):
+    elems = [types.TypeName(span, name) for name in names]
+    expected = elems[-1]
+    for elem in reversed(elems[:-1]):
+        expected = types.TypeApply.pair(span, elem, expected)
+
+    actual = types.TypeApply.tuple_(span, elems)
+    assert expected == actual
+    assert " , ".join(names) == pprint.show_type(actual)